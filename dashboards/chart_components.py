@@ -1,11 +1,57 @@
 """
 Professional Chart Components for Workforce Planning Dashboard
+
+Every create_* function is @cached_figure: its figure is kept in
+FIGURE_CACHE under a fingerprint of the arguments (a hash of the rows of a
+DataFrame/Series argument, the repr of anything else), so a rerun with the
+same aggregated data and parameters returns the already built and validated
+go.Figure instead of constructing it again. Inputs over FIGURE_CACHE_MAX_ROWS
+rows (raw tables rather than aggregates) are not cached. Cached figures are
+shared by all sessions and must not be modified.
 """
 
+import functools
+import hashlib
+
+import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from dashboard_config import COLORS, FONTS, CHART_CONFIG
+from result_cache import ResultCache
+
+FIGURE_CACHE_ENTRIES = 512
+FIGURE_CACHE_MAX_ROWS = 10_000
+
+FIGURE_CACHE = ResultCache(FIGURE_CACHE_ENTRIES, None)
+
+
+def fingerprint(value):
+    """Hashable stand-in for one argument, or None if it is too large or cannot be hashed"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        if len(value) > FIGURE_CACHE_MAX_ROWS:
+            return None
+        try:
+            rows = pd.util.hash_pandas_object(value, index=True).to_numpy()
+        except TypeError:
+            return None
+        layout = repr(value.dtypes.to_dict() if isinstance(value, pd.DataFrame) else (value.name, value.dtype))
+        return hashlib.sha1(rows.tobytes() + layout.encode()).hexdigest()
+    return repr(value)
+
+
+def cached_figure(func):
+    """Keep func's figures in FIGURE_CACHE, keyed by func's name and the fingerprint of its arguments"""
+    @functools.wraps(func)
+    def cached(*args, **kwargs):
+        names = [None] * len(args) + sorted(kwargs)
+        parts = [fingerprint(value) for value in args + tuple(kwargs[name] for name in names[len(args):])]
+        if None in parts:
+            return func(*args, **kwargs)
+        return FIGURE_CACHE.get_or_compute((func.__name__, *zip(names, parts)), lambda: func(*args, **kwargs))
+    return cached
+
 
+@cached_figure
 def create_bar_chart(data, x_col, y_col, title, color=None, horizontal=False):
     """Create a professional bar chart"""
     
@@ -40,6 +86,7 @@ def create_bar_chart(data, x_col, y_col, title, color=None, horizontal=False):
     return fig
 
 
+@cached_figure
 def create_line_chart(data, x_col, y_col, title, color=None, show_markers=True):
     """Create a professional line chart"""
     
@@ -66,6 +113,7 @@ def create_line_chart(data, x_col, y_col, title, color=None, show_markers=True):
     return fig
 
 
+@cached_figure
 def create_pie_chart(data, values_col, names_col, title, colors=None):
     """Create a professional pie chart"""
     
@@ -100,6 +148,7 @@ def create_pie_chart(data, values_col, names_col, title, colors=None):
     return fig
 
 
+@cached_figure
 def create_donut_chart(data, values_col, names_col, title, colors=None):
     """Create a professional donut chart"""
     
@@ -134,6 +183,7 @@ def create_donut_chart(data, values_col, names_col, title, colors=None):
     return fig
 
 
+@cached_figure
 def create_stacked_bar_chart(data, x_col, y_cols, title, colors=None):
     """Create a professional stacked bar chart"""
     
@@ -168,6 +218,7 @@ def create_stacked_bar_chart(data, x_col, y_cols, title, colors=None):
     return fig
 
 
+@cached_figure
 def create_grouped_bar_chart(data, x_col, y_cols, title, colors=None):
     """Create a professional grouped bar chart"""
     
@@ -202,6 +253,7 @@ def create_grouped_bar_chart(data, x_col, y_cols, title, colors=None):
     return fig
 
 
+@cached_figure
 def create_heatmap(data, x_col, y_col, z_col, title, colorscale='Blues'):
     """Create a professional heatmap"""
     
@@ -229,6 +281,7 @@ def create_heatmap(data, x_col, y_col, z_col, title, colorscale='Blues'):
     return fig
 
 
+@cached_figure
 def create_gauge_chart(value, title, min_val=0, max_val=100, threshold_low=30, 
                        threshold_high=70):
     """Create a professional gauge chart"""
@@ -273,6 +326,7 @@ def create_gauge_chart(value, title, min_val=0, max_val=100, threshold_low=30,
     return fig
 
 
+@cached_figure
 def create_multi_line_chart(data, x_col, y_cols, title, colors=None):
     """Create a professional multi-line chart"""
     
@@ -308,6 +362,7 @@ def create_multi_line_chart(data, x_col, y_cols, title, colors=None):
     return fig
 
 
+@cached_figure
 def create_scatter_plot(data, x_col, y_col, title, color_col=None, size_col=None):
     """Create a professional scatter plot"""
     
@@ -343,6 +398,7 @@ def create_scatter_plot(data, x_col, y_col, title, color_col=None, size_col=None
     return fig
 
 
+@cached_figure
 def create_histogram(data, x_col, title, nbins=30, color=None):
     """Create a professional histogram"""
     
@@ -367,6 +423,7 @@ def create_histogram(data, x_col, title, nbins=30, color=None):
     return fig
 
 
+@cached_figure
 def create_box_plot(data, x_col, y_col, title, color=None):
     """Create a professional box plot"""
     
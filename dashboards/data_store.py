@@ -0,0 +1,429 @@
+"""
+Embedded SQLite Store for the Processed Workforce Tables
+Optional dashboard backend: the processed tables are copied once into a
+local SQLite file, and the dashboard asks it for filtered counts and KPIs
+instead of holding every table in pandas
+
+The store lives next to the processed files (workforce_store.sqlite) and is
+rebuilt whenever one of them changes size or modification time. When that
+folder is read-only (a container image, a shared mount) it is built in the
+user cache folder instead; WORKFORCE_STORE_PATH (or db_path) names the file
+explicitly. Tables are
+copied in chunks, so building it never needs more than one chunk in memory.
+employees is stored already joined with department_master (as load_data
+does), and every table is indexed on the columns the filters and joins use
+(INDEXES).
+
+A StoreSelection is what apply_filters returns on this backend: the sidebar
+filters turned into a WHERE clause. count_values, row_count and kpis run as
+GROUP BY / COUNT / AVG queries; indexing a selection (selection['attrition'])
+still returns the filtered rows as a DataFrame for code that needs them.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+STORE_FILE = 'workforce_store.sqlite'
+STORE_PATH_ENV = 'WORKFORCE_STORE_PATH'
+
+# Dashboard table name -> processed file stem
+PROCESSED_TABLES = {
+    'employees': 'employees_master',
+    'attrition': 'attrition_events',
+    'performance': 'performance_reviews',
+    'engagement': 'engagement_surveys',
+    'departments': 'department_master',
+    'job_history': 'job_history',
+    'compensation': 'compensation_history',
+    'training': 'training_and_skills',
+    'attendance': 'attendance_records',
+}
+
+INDEXES = {
+    'employees': ['employee_id', 'department_id', 'department_name', 'hire_date'],
+    'attrition': ['employee_id', 'attrition_date'],
+    'performance': ['employee_id'],
+    'engagement': ['employee_id'],
+    'departments': ['department_id'],
+    'job_history': ['employee_id', 'department_id'],
+    'compensation': ['employee_id'],
+    'training': ['employee_id'],
+    'attendance': ['employee_id'],
+}
+
+CHUNK_ROWS = 200_000
+
+
+def source_path(base_path, table):
+    """The processed file a table is read from (Parquet copy preferred), or None"""
+    stem = PROCESSED_TABLES[table]
+    for ext in ('parquet', 'csv'):
+        path = os.path.join(base_path, f'{stem}_cleaned.{ext}')
+        if os.path.exists(path):
+            if ext == 'parquet':
+                try:
+                    import pyarrow.parquet  # noqa: F401
+                except ImportError:
+                    continue
+            return path
+    return None
+
+
+def iter_chunks(path, rows=CHUNK_ROWS):
+    """Read a processed file CHUNK_ROWS rows at a time"""
+    if path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=rows):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=rows)
+
+
+def source_signature(base_path):
+    """{file: [size, mtime_ns]} of every processed file the store is built from"""
+    signature = {}
+    for table in PROCESSED_TABLES:
+        path = source_path(base_path, table)
+        if path:
+            stat = os.stat(path)
+            signature[os.path.basename(path)] = [stat.st_size, stat.st_mtime_ns]
+    return signature
+
+
+def dataset_version(base_path):
+    """Short id of the processed files' current state; changes whenever source_signature does"""
+    signature = json.dumps(source_signature(base_path), sort_keys=True)
+    return hashlib.sha1(signature.encode()).hexdigest()[:12]
+
+
+def map_labels(codes, mapping):
+    """codes as a categorical of mapping's labels, categories in mapping order (codes not in it are missing)"""
+    positions = pd.Index(list(mapping)).get_indexer(codes)
+    return pd.Series(pd.Categorical.from_codes(positions, categories=list(mapping.values())),
+                     index=codes.index, name=codes.name)
+
+
+def _sql_ready(chunk):
+    """Datetimes as sortable ISO text, categories as their values"""
+    chunk = chunk.copy()
+    for column in chunk.columns:
+        values = chunk[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            chunk[column] = values.astype(values.cat.categories.dtype)
+        elif values.dtype.kind == 'M':
+            chunk[column] = values.dt.strftime('%Y-%m-%d %H:%M:%S')
+    return chunk
+
+
+def category_levels(path, first_chunk):
+    """
+    {column: [categories, ordered]} of a table's categorical columns. Read
+    from the whole column, since one chunk may not hold every category.
+    """
+    columns = [column for column, dtype in first_chunk.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)]
+    if not columns:
+        return {}
+    full = pd.read_parquet(path, columns=columns)
+    return {column: [full[column].cat.categories.tolist(), bool(full[column].cat.ordered)] for column in columns}
+
+
+def store_paths(base_path, db_path=None):
+    """
+    Where the store of base_path may live, in order of preference.
+
+    An explicit db_path (or WORKFORCE_STORE_PATH) is the only candidate.
+    Otherwise: next to the processed files, then a file per processed
+    folder in the user cache folder, then in the temp folder.
+    """
+    db_path = db_path or os.environ.get(STORE_PATH_ENV)
+    if db_path:
+        return [db_path]
+    cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    key = hashlib.sha1(os.path.abspath(base_path).encode()).hexdigest()[:12]
+    name = f'workforce_store_{key}.sqlite'
+    return [
+        os.path.join(base_path, STORE_FILE),
+        os.path.join(cache_root, 'workforce_dashboard', name),
+        os.path.join(tempfile.gettempdir(), name),
+    ]
+
+
+def stored_sources(db_path):
+    """The source signature a store was built from (None if missing or unreadable)"""
+    if not os.path.exists(db_path):
+        return None
+    try:
+        with contextlib.closing(sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)) as con:
+            row = con.execute("SELECT value FROM store_meta WHERE key = 'sources'").fetchone()
+    except sqlite3.DatabaseError:
+        return None
+    return json.loads(row[0]) if row else None
+
+
+def build_store(base_path, db_path):
+    """
+    Copy every available processed table into a fresh SQLite file.
+
+    Written to a temporary file and moved into place, so sessions reading
+    the previous store are never handed a half-built one.
+    """
+    tmp_path = db_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    try:
+        _write_store(base_path, tmp_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, db_path)
+
+
+def _write_store(base_path, tmp_path):
+    departments_path = source_path(base_path, 'departments')
+    departments = next(iter_chunks(departments_path)) if departments_path else None
+
+    dtypes = {}
+    categories = {}
+    with contextlib.closing(sqlite3.connect(tmp_path)) as con:
+        for table in PROCESSED_TABLES:
+            path = source_path(base_path, table)
+            if path is None:
+                continue
+            for i, chunk in enumerate(iter_chunks(path)):
+                if i == 0:
+                    categories[table] = category_levels(path, chunk)
+                if table == 'employees' and departments is not None:
+                    chunk = chunk.merge(departments, on='department_id', how='left')
+                    if i == 0:
+                        categories[table].update(category_levels(departments_path, departments))
+                if i == 0:
+                    dtypes[table] = {column: str(dtype) for column, dtype in chunk.dtypes.items()}
+                _sql_ready(chunk).to_sql(table, con, if_exists='replace' if i == 0 else 'append', index=False)
+            for column in INDEXES.get(table, []):
+                if column in dtypes[table]:
+                    con.execute(f'CREATE INDEX idx_{table}_{column} ON {table} ({column})')
+
+        con.execute('CREATE TABLE store_meta (key TEXT PRIMARY KEY, value TEXT)')
+        con.executemany('INSERT INTO store_meta VALUES (?, ?)', [
+            ('sources', json.dumps(source_signature(base_path), sort_keys=True)),
+            ('dtypes', json.dumps(dtypes)),
+            ('categories', json.dumps(categories)),
+        ])
+        con.commit()
+
+
+def _restore_dtype(values, dtype, levels=None):
+    """Turn a column read back from SQLite into the dtype it had in pandas"""
+    if dtype.startswith('datetime64'):
+        return pd.to_datetime(values)
+    if dtype in ('bool', 'boolean'):
+        return values.map({1: True, 0: False}).astype('boolean' if values.isna().any() else 'bool')
+    if dtype == 'category':
+        return values.astype(pd.CategoricalDtype(*levels) if levels else 'category')
+    return values
+
+
+class WorkforceStore:
+    """
+    Read-only query layer over workforce_store.sqlite.
+
+    Uses the first up-to-date store among store_paths(); otherwise builds
+    one at the first of them that is writable, and raises OSError if none
+    is. labels maps a table to {label column: (code column, mapping)}, the
+    label columns load_data derives; they are computed from the code column
+    after each query, so the store holds only the codes.
+    """
+
+    def __init__(self, base_path, labels=None, db_path=None):
+        self.labels = labels or {}
+        candidates = store_paths(base_path, db_path)
+        sources = source_signature(base_path)
+        self.db_path = next((path for path in candidates if stored_sources(path) == sources), None)
+        if self.db_path is None:
+            self.db_path = self._build(base_path, candidates)
+        with self._connect() as con:
+            meta = dict(con.execute("SELECT key, value FROM store_meta").fetchall())
+        self.dtypes = json.loads(meta['dtypes'])
+        self.categories = json.loads(meta['categories'])
+
+    def _connect(self):
+        # One short-lived read-only connection per query: Streamlit reruns
+        # on different threads and sqlite3 connections are thread-bound
+        return contextlib.closing(sqlite3.connect(f'file:{self.db_path}?mode=ro', uri=True))
+
+    @staticmethod
+    def _build(base_path, candidates):
+        errors = []
+        for path in candidates:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                build_store(base_path, path)
+                return path
+            except (OSError, sqlite3.Error) as exc:
+                errors.append(f"{path}: {exc}")
+        raise OSError("Cannot build the SQLite store: " + "; ".join(errors))
+
+    def query(self, sql, params=()):
+        with self._connect() as con:
+            return pd.read_sql_query(sql, con, params=list(params))
+
+    def has_table(self, table):
+        return table in self.dtypes
+
+    def columns(self, table):
+        return list(self.dtypes.get(table, {})) + list(self.labels.get(table, {}))
+
+    def distinct(self, table, column):
+        """Sorted distinct non-null values of one column"""
+        values = self.query(f'SELECT DISTINCT {column} AS value FROM {table} '
+                            f'WHERE {column} IS NOT NULL ORDER BY value')['value']
+        return self.restore(values, table, column).tolist()
+
+    def restore(self, values, table, column):
+        """values of table.column read back from SQLite, in their pandas dtype"""
+        return _restore_dtype(values, self.dtypes[table][column], self.categories.get(table, {}).get(column))
+
+    def maximum(self, table, column):
+        return self.query(f'SELECT MAX({column}) AS value FROM {table}')['value'].iloc[0]
+
+    def select(self, departments, job_levels, tenure_range, results=None):
+        return StoreSelection(self, departments, job_levels, tenure_range, results)
+
+
+class StoreSelection:
+    """
+    The employees matching the sidebar filters, and their rows in other
+    tables. results is the FilterResults (result_cache.py) the dashboard
+    keeps this filter combination's answers in, or None.
+    """
+
+    def __init__(self, store, departments, job_levels, tenure_range, results=None):
+        self.store = store
+        self.results = results
+        clauses = []
+        self.params = []
+        if departments:
+            clauses.append(f"e.department_name IN ({', '.join('?' * len(departments))})")
+            self.params += list(departments)
+        if job_levels:
+            clauses.append(f"e.job_level IN ({', '.join('?' * len(job_levels))})")
+            self.params += [int(level) for level in job_levels]
+        clauses.append('e.tenure_years >= ? AND e.tenure_years <= ?')
+        self.params += [float(tenure_range[0]), float(tenure_range[1])]
+        self.where = ' AND '.join(clauses)
+        self._frames = {}
+
+    def _query(self, select, table, join_employees=False, conditions=(), select_params=(), group_by=None):
+        """
+        Run SELECT <select> over one table of the selection. employees and
+        every table with an employee_id are restricted to the selected
+        employees; lookup tables (departments) are not.
+        """
+        if table == 'employees':
+            sql, where, params = 'FROM employees e', [self.where], list(self.params)
+        elif 'employee_id' in self.store.dtypes.get(table, {}) or join_employees:
+            sql = f'FROM {table} t JOIN employees e ON e.employee_id = t.employee_id'
+            where, params = [self.where], list(self.params)
+        else:
+            sql, where, params = f'FROM {table} t', [], []
+        where += list(conditions)
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        if group_by:
+            sql += f' GROUP BY {group_by}'
+        return self.store.query(f'SELECT {select} {sql}', list(select_params) + params)
+
+    def columns(self, table):
+        return self.store.columns(table)
+
+    def row_count(self, table):
+        if not self.store.has_table(table):
+            return 0
+        return int(self._query('COUNT(*) AS n', table)['n'].iloc[0])
+
+    def count_values(self, table, column):
+        """
+        Equivalent of value_counts() on one column of a filtered table (the
+        values that occur), computed by a GROUP BY. Label columns are counted
+        on their code column and mapped afterwards; a column of employees
+        (such as department_name) can be counted over a child table's rows.
+        """
+        if not self.store.has_table(table):
+            return pd.Series(dtype='int64', name='count')
+        label = self.store.labels.get(table, {}).get(column)
+        source_column = label[0] if label else column
+        on_employees = table != 'employees' and source_column not in self.store.dtypes[table]
+        qualified = f"{'e' if table == 'employees' or on_employees else 't'}.{source_column}"
+
+        # MIN(rowid) is the value's first row, to break ties as value_counts does
+        first_row = f"{'e' if table == 'employees' else 't'}.rowid"
+        counts = self._query(f'{qualified} AS value, COUNT(*) AS n, MIN({first_row}) AS first', table,
+                             join_employees=on_employees, conditions=[f'{qualified} IS NOT NULL'], group_by='value')
+
+        values = self.store.restore(counts['value'], 'employees' if on_employees else table, source_column)
+        if label:
+            values = map_labels(values, label[1])
+        counts.index = pd.Index(values, name=column)
+        counts = counts[counts.index.notna()].groupby(level=0, sort=False, observed=True).agg({'n': 'sum', 'first': 'min'})
+        # Most frequent first, ties in order of first appearance, like value_counts
+        order = np.lexsort((counts['first'].to_numpy(), -counts['n'].to_numpy()))
+        return counts['n'].iloc[order].rename('count')
+
+    def count_bins(self, table, column, bins, labels):
+        """Equivalent of pd.cut(column, bins, labels).value_counts().sort_index()"""
+        cases = ' '.join(f'WHEN t.{column} > ? AND t.{column} <= ? THEN {i}' for i in range(len(labels)))
+        edges = [edge for pair in zip(bins[:-1], bins[1:]) for edge in pair]
+        counts = self._query(f'CASE {cases} END AS bin, COUNT(*) AS n', table,
+                             select_params=edges, group_by='bin')
+        counts = counts.dropna(subset=['bin']).set_index('bin')['n']
+        return pd.Series([int(counts.get(i, 0)) for i in range(len(labels))],
+                         index=pd.CategoricalIndex(labels, categories=labels, ordered=True), name='count')
+
+    def kpis(self):
+        """calculate_kpis() for the selection, as aggregate queries"""
+        employee_columns = self.store.dtypes.get('employees', {})
+        active = "SUM(e.status = 'Active')" if 'status' in employee_columns else 'COUNT(*)'
+        totals = self._query(f'COUNT(*) AS total, {active} AS active, AVG(e.tenure_years) AS avg_tenure',
+                             'employees').iloc[0]
+        total_employees = int(totals['total'])
+        attrition_count = self.row_count('attrition')
+        attrition_rate = (attrition_count / total_employees * 100) if total_employees > 0 else 0
+
+        avg_satisfaction = 0
+        engagement_columns = self.store.dtypes.get('engagement', {})
+        for column in ('engagement_score', 'job_satisfaction'):
+            if column in engagement_columns:
+                mean = self._query(f'AVG(t.{column}) AS mean', 'engagement')['mean'].iloc[0]
+                avg_satisfaction = 0 if pd.isna(mean) else float(mean)
+                break
+
+        return {
+            'total_employees': total_employees,
+            'active_employees': int(totals['active'] or 0),
+            'attrition_rate': attrition_rate,
+            'retention_rate': 100 - attrition_rate,
+            'avg_tenure': float(totals['avg_tenure']) if total_employees > 0 else 0,
+            'avg_satisfaction': avg_satisfaction,
+        }
+
+    def __getitem__(self, table):
+        """The selection's rows of one table as a DataFrame (read on first use)"""
+        if table not in self._frames:
+            if not self.store.has_table(table):
+                return pd.DataFrame()
+            df = self._query(f"{'e' if table == 'employees' else 't'}.*", table)
+            for column in self.store.dtypes[table]:
+                df[column] = self.store.restore(df[column], table, column)
+            for label, (code_column, mapping) in self.store.labels.get(table, {}).items():
+                df[label] = map_labels(df[code_column], mapping)
+            self._frames[table] = df
+        return self._frames[table]
@@ -0,0 +1,65 @@
+"""
+Positional employee_id Index for the Dashboard's Child Tables
+Filters the tables keyed by employee_id to the selected employees by
+gathering precomputed row ranges instead of isin() against an ID list
+
+Built once per dataset and table (the first time the table is filtered), in
+CSR layout: a child table's row positions are sorted by the position of
+their employee in the employees table, and offsets[i]:offsets[i + 1] is the
+slice of that order holding employee i's rows. Selecting employees (as
+positions in employees) is then a repeat/arange gather over their slices;
+the gathered positions are sorted so the result keeps the table's row
+order, exactly as isin() would.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class EmployeeRowIndex:
+    """Rows of one child table per employee, as offsets into a sorted row order"""
+
+    def __init__(self, employee_ids, child_employee_ids):
+        owner = pd.Index(employee_ids).get_indexer(child_employee_ids)
+        matched = np.flatnonzero(owner >= 0)
+        # Rows of unknown employees never match a selection and are left out
+        self.order = matched[np.argsort(owner[matched], kind='stable')]
+        counts = np.bincount(owner[matched], minlength=len(employee_ids))
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    def rows(self, employee_positions):
+        """Row positions, in table order, of the employees at employee_positions"""
+        starts = self.offsets[employee_positions]
+        lengths = self.offsets[np.asarray(employee_positions) + 1] - starts
+        total = int(lengths.sum())
+        # Position k of the output reads order[start of its slice + offset within it]
+        slice_starts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return np.sort(self.order[slice_starts + np.arange(total)])
+
+    def take(self, table, employee_positions):
+        return table.iloc[self.rows(employee_positions)]
+
+
+class RowIndexes:
+    """
+    The EmployeeRowIndex of each child table of one dataset, built the first
+    time that table is filtered. Unusable when employee_id is not unique,
+    since a row could then belong to several employees; take() then returns
+    None and callers fall back to isin().
+    """
+
+    def __init__(self, employees):
+        self.employee_ids = employees['employee_id']
+        self.usable = self.employee_ids.is_unique
+        self.indexes = {}
+
+    def index(self, name, table):
+        if name not in self.indexes:
+            self.indexes[name] = EmployeeRowIndex(self.employee_ids, table['employee_id'])
+        return self.indexes[name]
+
+    def take(self, name, table, employee_positions):
+        """table (the child table called name) narrowed to the employees at employee_positions"""
+        if not self.usable:
+            return None
+        return self.index(name, table).take(table, employee_positions)
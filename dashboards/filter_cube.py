@@ -0,0 +1,198 @@
+"""
+Precomputed Aggregate Cube over the Dashboard's Filter Dimensions
+Built once per dataset, so the KPIs and the Overview/Demographics counts are
+answered by summing a few hundred cube cells instead of rescanning employees
+
+The sidebar filters on department_name, job_level and tenure_years. The
+slider only produces whole years and the filter is tenure >= low and
+tenure <= high, so tenure is stored as two keys: floor(tenure) and whether
+tenure is exactly that whole number. A range [low, high] then selects the
+cells with low <= floor < high, plus the floor == high cells that are whole,
+which is exactly the rows the pandas filter keeps.
+
+- The base cuboid is grouped by the filter keys alone and carries the KPI
+  measures: employees, active employees, tenure sum, attrition events and
+  the engagement sum/count of the satisfaction column calculate_kpis uses.
+- Each CUBE_ATTRIBUTES column gets a cuboid grouped by the filter keys plus
+  that column, with the row count and the position of its first row. The
+  first positions let count_values return the categories in exactly the
+  order value_counts would (count descending, ties by first occurrence).
+"""
+
+import numpy as np
+import pandas as pd
+
+FILTER_KEYS = ['department_name', 'job_level', 'tenure_floor', 'tenure_whole']
+
+# Employee columns the Overview and Demographics tabs count
+CUBE_ATTRIBUTES = [
+    'department_name', 'job_level_label', 'tenure_category', 'gender', 'age_group',
+    'marital_status', 'education_level_label', 'employment_type', 'work_location',
+]
+
+# calculate_kpis averages the first of these the engagement table has
+SATISFACTION_COLUMNS = ['engagement_score', 'job_satisfaction']
+
+
+def _per_employee(employee_ids, table, column=None):
+    """Rows (or non-null values of column, and their sum) of table per employee, aligned to employee_ids"""
+    if column is None:
+        counts = table['employee_id'].value_counts()
+        return employee_ids.map(counts).fillna(0).to_numpy(dtype=np.int64)
+    values = table[['employee_id', column]].dropna(subset=[column])
+    grouped = values.groupby('employee_id')[column]
+    return (employee_ids.map(grouped.count()).fillna(0).to_numpy(dtype=np.int64),
+            employee_ids.map(grouped.sum()).fillna(0).to_numpy(dtype=np.float64))
+
+
+def _encode(values):
+    """
+    (codes, uniques) of a column: categories in category order for a
+    categorical, otherwise in order of first appearance. Missing values get -1.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(dtype=np.int64), pd.CategoricalIndex(values.cat.categories, dtype=values.dtype)
+    codes, uniques = pd.factorize(values)
+    return codes.astype(np.int64), uniques
+
+
+def _selected(uniques, chosen):
+    """
+    Lookup array: True for the codes of uniques in chosen (all of them when
+    nothing is chosen). The extra last entry is what code -1 (missing) maps to.
+    """
+    if not chosen:
+        return np.ones(len(uniques) + 1, dtype=bool)
+    return np.append(uniques.isin(chosen), False)
+
+
+class Cuboid:
+    """Cells of one grouping as parallel arrays: filter key codes, value codes and measures"""
+
+    def __init__(self, keys, measures, aggregations):
+        cells = pd.concat([keys, measures], axis=1).groupby(list(keys.columns), sort=False).agg(aggregations)
+        cells = cells.reset_index()
+        self.keys = {column: cells[column].to_numpy() for column in keys.columns}
+        self.measures = {column: cells[column].to_numpy() for column in measures.columns}
+
+    def __len__(self):
+        return len(self.keys['tenure_floor'])
+
+
+class FilterCube:
+    """
+    Cuboids of employees (joined with departments and labelled, as load_data
+    returns them) for every combination of the sidebar filter values.
+    """
+
+    def __init__(self, employees, attrition, engagement):
+        employees = employees[employees['tenure_years'].notna()].reset_index(drop=True)
+        tenure = employees['tenure_years'].to_numpy(dtype=np.float64)
+        tenure_floor = np.floor(tenure)
+
+        department_codes, self.departments = _encode(employees['department_name'])
+        level_codes, self.job_levels = _encode(employees['job_level'])
+        keys = pd.DataFrame({
+            'department_name': department_codes,
+            'job_level': level_codes,
+            'tenure_floor': tenure_floor.astype(np.int64),
+            'tenure_whole': tenure == tenure_floor,
+        })
+
+        ids = employees['employee_id']
+        measures = pd.DataFrame({
+            'employees': np.ones(len(employees), dtype=np.int64),
+            'active': (employees['status'] == 'Active').to_numpy(dtype=np.int64)
+                      if 'status' in employees.columns else 1,
+            'tenure_sum': tenure,
+            'attrition_events': _per_employee(ids, attrition),
+            'engagement_rows': _per_employee(ids, engagement),
+        })
+        self.satisfaction_column = next((c for c in SATISFACTION_COLUMNS if c in engagement.columns), None)
+        if self.satisfaction_column:
+            measures['satisfaction_count'], measures['satisfaction_sum'] = _per_employee(
+                ids, engagement, self.satisfaction_column)
+        self.base = Cuboid(keys, measures, 'sum')
+
+        self.cuboids = {}
+        self.values = {}
+        for column in CUBE_ATTRIBUTES:
+            if column not in employees.columns:
+                continue
+            codes, self.values[column] = _encode(employees[column])
+            present = codes >= 0
+            self.cuboids[column] = Cuboid(
+                keys[present].assign(value=codes[present]),
+                pd.DataFrame({'n': np.ones(present.sum(), dtype=np.int64),
+                              'first': np.flatnonzero(present)}),
+                {'n': 'sum', 'first': 'min'},
+            )
+
+    def covers(self, tenure_range):
+        """True if the tenure bounds are whole years, the only ranges the cube answers exactly"""
+        return all(float(bound).is_integer() for bound in tenure_range)
+
+    def select(self, departments, job_levels, tenure_range):
+        """The cube cells apply_filters would keep, or None if it cannot answer the range"""
+        if not self.covers(tenure_range):
+            return None
+        return CubeSelection(self, departments, job_levels, tenure_range)
+
+
+class CubeSelection:
+    """KPIs and employee value counts of one filter combination, from the cube"""
+
+    def __init__(self, cube, departments, job_levels, tenure_range):
+        self.cube = cube
+        self.departments = _selected(cube.departments, departments)
+        self.job_levels = _selected(cube.job_levels, job_levels)
+        self.tenure = (int(tenure_range[0]), int(tenure_range[1]))
+
+    def _mask(self, cuboid):
+        low, high = self.tenure
+        floor = cuboid.keys['tenure_floor']
+        return (self.departments[cuboid.keys['department_name']]
+                & self.job_levels[cuboid.keys['job_level']]
+                & (floor >= low)
+                & ((floor < high) | ((floor == high) & cuboid.keys['tenure_whole'])))
+
+    def has(self, column):
+        return column in self.cube.cuboids
+
+    def count_values(self, column):
+        """Employees' column.value_counts() for the selection, identical to count_values' pandas result"""
+        cuboid = self.cube.cuboids[column]
+        values = self.cube.values[column]
+        mask = self._mask(cuboid)
+        codes = cuboid.keys['value'][mask]
+        counts = np.bincount(codes, weights=cuboid.measures['n'][mask], minlength=len(values)).astype(np.int64)
+
+        # The values that occur, in order of first appearance (categoricals too)
+        first = np.full(len(values), np.iinfo(np.int64).max)
+        np.minimum.at(first, codes, cuboid.measures['first'][mask])
+        order = np.argsort(first, kind='stable')[:np.count_nonzero(counts)]
+
+        result = pd.Series(counts[order], index=values[order], name='count').rename_axis(column)
+        return result.sort_values(ascending=False, kind='stable')
+
+    def kpis(self):
+        """calculate_kpis() of the selection"""
+        mask = self._mask(self.cube.base)
+        totals = {column: values[mask].sum() for column, values in self.cube.base.measures.items()}
+        total_employees = int(totals['employees'])
+        attrition_rate = (int(totals['attrition_events']) / total_employees * 100) if total_employees > 0 else 0
+
+        if self.cube.satisfaction_column and totals['engagement_rows'] > 0:
+            count = totals['satisfaction_count']
+            avg_satisfaction = totals['satisfaction_sum'] / count if count else np.nan
+        else:
+            avg_satisfaction = 0
+
+        return {
+            'total_employees': total_employees,
+            'active_employees': int(totals['active']),
+            'attrition_rate': attrition_rate,
+            'retention_rate': 100 - attrition_rate,
+            'avg_tenure': totals['tenure_sum'] / total_employees if total_employees > 0 else 0,
+            'avg_satisfaction': avg_satisfaction,
+        }
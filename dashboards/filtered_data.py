@@ -0,0 +1,76 @@
+"""
+Lazily Filtered Tables for the Interactive Dashboard
+What apply_filters returns on the pandas backend: the employees matching the
+sidebar filters, and every table keyed by employee_id narrowed to them, each
+computed the first time a tab reads it
+
+Tables missing from the loaded data (job_history, compensation, training and
+attendance are not read by load_data) are loaded through load_table on first
+access, so a run that never opens them never reads them. Lookup tables
+without an employee_id column (departments) are returned as loaded.
+
+With a FilterResults (result_cache.py) the filtered tables are kept in the
+shared result cache, so another run or session with the same filters
+reuses them instead of filtering again.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class FilteredData(Mapping):
+    """
+    Read-only {table: filtered frame} view of one filter combination.
+
+    data is load_data's dict, keep the boolean employee mask, load_table a
+    callable returning an unloaded table by name, row_indexes the dataset's
+    RowIndexes (or None for isin), cube the filter cube's selection and
+    results the FilterResults of this filter combination (or None).
+    """
+
+    def __init__(self, data, keep, tables, load_table, row_indexes=None, cube=None, results=None):
+        self.data = data
+        self.keep = keep
+        self.tables = list(tables)
+        self.load_table = load_table
+        self.row_indexes = row_indexes
+        self.cube = cube
+        self.results = results
+        self.frames = {}
+
+    def __getitem__(self, table):
+        if table == 'cube' and self.cube is not None:
+            return self.cube
+        if table not in self.tables:
+            raise KeyError(table)
+        if table not in self.frames:
+            if self.results is None:
+                self.frames[table] = self._filter(table)
+            else:
+                self.frames[table] = self.results.get(('table', table), lambda: self._filter(table))
+        return self.frames[table]
+
+    def __iter__(self):
+        yield from self.tables
+        if self.cube is not None:
+            yield 'cube'
+
+    def __len__(self):
+        return len(self.tables) + (self.cube is not None)
+
+    def loaded(self):
+        """Names of the tables filtered so far"""
+        return list(self.frames)
+
+    def _filter(self, table):
+        if table == 'employees':
+            return self.data['employees'][self.keep]
+        frame = self.data[table] if table in self.data else self.load_table(table)
+        if 'employee_id' not in frame.columns:
+            return frame
+        if self.row_indexes is not None:
+            filtered = self.row_indexes.take(table, frame, np.flatnonzero(self.keep.to_numpy()))
+            if filtered is not None:
+                return filtered
+        return frame[frame['employee_id'].isin(self['employees']['employee_id'])]
@@ -0,0 +1,103 @@
+"""
+Filter-Keyed Result Cache Shared by All Dashboard Sessions
+Filtered tables, KPIs and per-section counts are kept per normalized filter
+combination and dataset version, so a slice any session has looked at is
+answered without filtering or counting again
+
+Keys are (dataset version, departments, job levels, tenure range, name):
+the filters are sorted tuples, so the same slice picked in a different order
+hits the same entries, and a new dataset version never sees old results.
+Only the filter values are hashed, never the data.
+
+The cache is bounded by entry count and by the estimated memory of the
+cached values; the least recently used entries are evicted first. Values
+are shared between sessions and must not be modified by callers. Two
+sessions missing the same entry at once may both compute it; the second
+result simply replaces the first.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def estimate_bytes(value):
+    """Approximate memory held by a cached value"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_bytes(k) + estimate_bytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_bytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def filter_key(version, departments, job_levels, tenure_range):
+    """Normalized cache key of one filter combination"""
+    return (version, tuple(sorted(departments)), tuple(sorted(int(level) for level in job_levels)),
+            tuple(float(bound) for bound in tenure_range))
+
+
+class ResultCache:
+    """Thread-safe LRU cache bounded by max_entries and max_bytes (None: entries only)"""
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key][0]
+            self.misses += 1
+
+        value = compute()
+        size = estimate_bytes(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return value
+
+        with self.lock:
+            if key in self.entries:
+                self.bytes -= self.entries.pop(key)[1]
+            self.entries[key] = (value, size)
+            self.bytes += size
+            while len(self.entries) > self.max_entries or (self.max_bytes is not None and self.bytes > self.max_bytes):
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.bytes -= evicted
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {'entries': len(self.entries), 'bytes': self.bytes, 'hits': self.hits,
+                'misses': self.misses, 'hit_rate': self.hits / lookups if lookups else 0.0}
+
+
+class FilterResults:
+    """The entries of one filter combination in a ResultCache"""
+
+    def __init__(self, cache, key):
+        self.cache = cache
+        self.key = key
+
+    def get(self, name, compute):
+        """compute() once per filter combination and dataset version"""
+        return self.cache.get_or_compute(self.key + (name,), compute)
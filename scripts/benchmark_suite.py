@@ -0,0 +1,502 @@
+"""
+Benchmark Suite
+Purpose: Time the cleaning pipeline and the dashboard's data and chart
+functions at several data scales, and fail when a run regresses against the
+baseline stored in benchmark_baseline.json
+
+For every scale the suite generates a clean synthetic raw dataset with
+generate_synthetic_data.py (scale 1 = 5,000 employees, ~330k rows with
+attendance) and times:
+
+- pipeline:   every data_cleaning_pipeline step (wall time from its profile record)
+- dashboard:  streamlit_app.load_data (cold cache), apply_filters for the
+              FILTER_CASES combinations (with the employee_id row index, reading
+              employees, attrition, performance and engagement) and
+              calculate_kpis on the filtered data;
+              building the filter cube, and the same KPIs plus the employee
+              value counts answered from it, and from a warm result cache
+- charts:     every chart_components.create_* builder, fed the same kind of
+              aggregates the dashboard passes it, built from scratch (empty
+              figure cache) and again answered from the figure cache
+- equivalence (opt-in): re-clean with each EQUIVALENCE_ENGINES engine and
+              compare its tables with the reference output using
+              equivalence_check.py; any difference fails the run
+
+Each benchmark keeps the best of --repeat runs and their spread (slowest -
+fastest). A benchmark regresses when it is more than --threshold slower than
+its baseline and the difference is above its noise: the larger spread, now or
+in the baseline, and at least NOISE_FLOOR_S. A steady 8ms filter is caught
+at 10ms; a chart whose runs vary by 20ms is not failed by that variation.
+
+Usage:
+    python benchmark_suite.py                          # compare with the baseline
+    python benchmark_suite.py --scales 1 --groups dashboard charts
+    python benchmark_suite.py --scales 3 --groups equivalence      # ~1M rows
+    python benchmark_suite.py --update-baseline        # record a new baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from data_cleaning_pipeline import run_pipeline
+from equivalence_check import compare_outputs, is_identical, print_diff_summary, run_engine
+from generate_synthetic_data import generate_dataset, write_dataset
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DASHBOARD_DIR = os.path.join(os.path.dirname(SCRIPT_DIR), "dashboards")
+BASELINE_FILE = os.path.join(SCRIPT_DIR, "benchmark_baseline.json")
+BASELINE_VERSION = 2
+
+DEFAULT_SCALES = [1, 5]
+DEFAULT_REPEAT = 3
+DEFAULT_SEED = 42
+
+# A benchmark fails when it is this much slower than its baseline...
+DEFAULT_THRESHOLD = 0.25
+# ...and the slowdown exceeds the spread of its repeat runs (now or in the
+# baseline, whichever is larger) and this many seconds of timer jitter
+NOISE_FLOOR_S = 0.002
+
+GROUPS = ['pipeline', 'dashboard', 'charts', 'equivalence']
+DEFAULT_GROUPS = ['pipeline', 'dashboard', 'charts']
+
+# Engines (equivalence_check.ENGINES) checked against the reference output
+EQUIVALENCE_ENGINES = ['chunked', 'parallel']
+
+# Tables the dashboard's apply_filters narrows for its tabs
+FILTERED_TABLES = ['attrition', 'performance', 'engagement']
+
+# apply_filters(data, departments, job_levels, tenure_range) arguments per
+# case; each builder gets the loaded data and the full tenure range
+FILTER_CASES = {
+    'no_filters': lambda data, tenure: ([], [], tenure),
+    'one_department': lambda data, tenure: (departments(data)[:1], [], tenure),
+    'half_departments': lambda data, tenure: (departments(data)[::2], [], tenure),
+    'job_levels_1_2': lambda data, tenure: ([], [1, 2], tenure),
+    'tenure_0_5': lambda data, tenure: ([], [], (0, 5)),
+    'combined': lambda data, tenure: (departments(data)[:5], [2, 3, 4], (2, 10)),
+}
+
+
+def departments(data):
+    return sorted(data['employees']['department_name'].dropna().unique())
+
+
+def import_dashboard():
+    """
+    Import streamlit_app and chart_components from the dashboards folder.
+
+    streamlit_app configures the page at import time; outside `streamlit run`
+    that only logs bare-mode warnings, which are silenced here.
+    """
+    if DASHBOARD_DIR not in sys.path:
+        sys.path.insert(0, DASHBOARD_DIR)
+    # Nothing else in the suite logs, so the bare-mode warnings go with it
+    logging.disable(logging.WARNING)
+    import chart_components
+    import streamlit_app
+    return streamlit_app, chart_components
+
+
+def timing(times):
+    """{'best', 'spread'} of a benchmark's repeat wall times; spread is max - min"""
+    return {'best': min(times), 'spread': max(times) - min(times)}
+
+
+def best_time(func, repeat):
+    """timing() of `repeat` calls, and the last call's result"""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return timing(times), result
+
+
+def prepare_scale(scale, seed, work_dir):
+    """Generate (or reuse) the raw data for one scale; returns (raw_dir, out_dir)"""
+    raw_dir = os.path.join(work_dir, f"scale_{scale:g}_seed_{seed}", "raw")
+    out_dir = os.path.join(work_dir, f"scale_{scale:g}_seed_{seed}", "processed")
+    if not os.path.exists(os.path.join(raw_dir, "training_and_skills.csv")):
+        tables, _ = generate_dataset(scale, seed)
+        with contextlib.redirect_stdout(io.StringIO()):
+            write_dataset(tables, raw_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    return raw_dir, out_dir
+
+
+def bench_pipeline(raw_dir, out_dir, repeat):
+    """timing() of every cleaning step over `repeat` full pipeline runs"""
+    times = {}
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, records = run_pipeline(raw_dir, out_dir)
+        for record in records:
+            times.setdefault(f"pipeline.{record['step']}", []).append(record['wall_time_s'])
+    return {key: timing(step_times) for key, step_times in times.items()}
+
+
+def bench_dashboard(app, out_dir, repeat):
+    """load_data, apply_filters per FILTER_CASES entry, calculate_kpis, the filter cube and the result cache"""
+    results = {}
+
+    def cold_load():
+        app.load_data.clear()
+        return app.load_data(out_dir)
+
+    results['dashboard.load_data'], data = best_time(cold_load, repeat)
+
+    def build_row_index():
+        row_index = app.RowIndexes(data['employees'])
+        for table in FILTERED_TABLES:
+            row_index.index(table, data[table])
+        return row_index
+
+    def filter_tables(args):
+        # apply_filters is lazy: read the tables the tabs read
+        filtered = app.apply_filters(data, *args, row_index=row_index)
+        for table in ['employees'] + FILTERED_TABLES:
+            filtered[table]
+        return filtered
+
+    results['dashboard.build_row_index'], row_index = best_time(build_row_index, repeat)
+
+    tenure = (0, int(data['employees']['tenure_years'].max()))
+    for case, build in FILTER_CASES.items():
+        args = build(data, tenure)
+        results[f'dashboard.apply_filters.{case}'], filtered_case = best_time(
+            lambda: filter_tables(args), repeat
+        )
+        results[f'dashboard.calculate_kpis.{case}'], _ = best_time(
+            lambda: app.calculate_kpis(filtered_case), repeat
+        )
+
+    results['dashboard.build_cube'], cube = best_time(
+        lambda: app.FilterCube(data['employees'], data['attrition'], data['engagement']), repeat
+    )
+
+    def cube_answers(args):
+        selection = cube.select(*args)
+        return selection.kpis(), [selection.count_values(column) for column in app.CUBE_ATTRIBUTES
+                                  if selection.has(column)]
+
+    for case, build in FILTER_CASES.items():
+        args = build(data, tenure)
+        results[f'dashboard.cube_answers.{case}'], _ = best_time(lambda: cube_answers(args), repeat)
+
+    cache = app.ResultCache(app.RESULT_CACHE_ENTRIES, app.RESULT_CACHE_MB * 1024 ** 2)
+
+    def cached_answers(args):
+        filtered = app.apply_filters(data, *args, cube=cube, row_index=row_index, cache=cache, version='benchmark')
+        return app.calculate_kpis(filtered), [app.count_values(filtered, 'employees', column)
+                                              for column in app.CUBE_ATTRIBUTES]
+
+    for case, build in FILTER_CASES.items():
+        args = build(data, tenure)
+        # Timed warm: what a filter combination any session has already seen costs
+        cached_answers(args)
+        results[f'dashboard.cached_answers.{case}'], _ = best_time(lambda: cached_answers(args), repeat)
+    return results
+
+
+def chart_inputs(data, kpis):
+    """The frames each create_* builder is benchmarked with"""
+    employees = data['employees']
+    attrition = data['attrition']
+
+    dept_counts = employees['department_name'].value_counts().head(10)
+    level_counts = employees['job_level_label'].value_counts()
+    status_by_dept = pd.crosstab(employees['department_name'], employees['status']).reset_index()
+    status_cols = [col for col in status_by_dept.columns if col != 'department_name']
+
+    hires = pd.to_datetime(employees['hire_date']).dt.year.value_counts()
+    exits = pd.to_datetime(attrition['attrition_date']).dt.year.value_counts()
+    by_year = pd.DataFrame({'hires': hires, 'exits': exits}).fillna(0).sort_index()
+    by_year = by_year.rename_axis('year').reset_index()
+
+    return {
+        'create_bar_chart': lambda c: c.create_bar_chart(
+            pd.DataFrame({'department': dept_counts.index, 'count': dept_counts.values}),
+            'department', 'count', 'Top 10 Departments by Headcount'),
+        'create_line_chart': lambda c: c.create_line_chart(by_year, 'year', 'exits', 'Exits by Year'),
+        'create_pie_chart': lambda c: c.create_pie_chart(
+            pd.DataFrame({'level': level_counts.index, 'count': level_counts.values}),
+            'count', 'level', 'Employees by Job Level'),
+        'create_donut_chart': lambda c: c.create_donut_chart(
+            pd.DataFrame({'level': level_counts.index, 'count': level_counts.values}),
+            'count', 'level', 'Employees by Job Level'),
+        'create_stacked_bar_chart': lambda c: c.create_stacked_bar_chart(
+            status_by_dept, 'department_name', status_cols, 'Status by Department'),
+        'create_grouped_bar_chart': lambda c: c.create_grouped_bar_chart(
+            status_by_dept, 'department_name', status_cols, 'Status by Department'),
+        'create_heatmap': lambda c: c.create_heatmap(
+            employees, 'department_name', 'job_level_label', 'tenure_years', 'Tenure by Department and Level'),
+        'create_gauge_chart': lambda c: c.create_gauge_chart(
+            kpis['attrition_rate'], 'Attrition Rate (%)', min_val=0, max_val=50,
+            threshold_low=15, threshold_high=25),
+        'create_multi_line_chart': lambda c: c.create_multi_line_chart(
+            by_year, 'year', ['hires', 'exits'], 'Hires and Exits by Year'),
+        'create_scatter_plot': lambda c: c.create_scatter_plot(
+            employees, 'age', 'tenure_years', 'Age vs Tenure', color_col='job_level_label'),
+        'create_histogram': lambda c: c.create_histogram(employees, 'tenure_years', 'Tenure Distribution'),
+        'create_box_plot': lambda c: c.create_box_plot(
+            data['performance'], 'performance_rating_label', 'goal_completion_pct', 'Goal Completion by Rating'),
+    }
+
+
+def bench_charts(app, charts, out_dir, repeat):
+    """Every chart_components.create_* builder on the unfiltered dashboard data"""
+    # The chart inputs use columns the dashboard does not load, so read whole tables
+    data = app.load_data(out_dir, columns={})
+    results = {}
+    for name, build in chart_inputs(data, app.calculate_kpis(data)).items():
+        def build_uncached():
+            charts.FIGURE_CACHE.clear()
+            return build(charts)
+
+        results[f'charts.{name}'], _ = best_time(build_uncached, repeat)
+        build(charts)
+        results[f'charts.cached.{name}'], _ = best_time(lambda: build(charts), repeat)
+    return results
+
+
+def bench_equivalence(raw_dir, out_dir, engines):
+    """
+    Clean raw_dir with each engine once and compare with the reference tables
+    in out_dir. Returns (timings, names of engines whose output differs).
+    """
+    results = {}
+    mismatched = []
+    for engine in engines:
+        engine_dir = os.path.join(os.path.dirname(out_dir), engine)
+        results[f'equivalence.{engine}.run'] = timing([run_engine(engine, raw_dir, engine_dir)])
+        start = time.perf_counter()
+        diffs = compare_outputs(out_dir, engine_dir)
+        results[f'equivalence.{engine}.compare'] = timing([time.perf_counter() - start])
+        if not all(is_identical(diff) for diff in diffs.values()):
+            print_diff_summary(diffs, engine)
+            mismatched.append(engine)
+    return results, mismatched
+
+
+def run_benchmarks(scales, repeat, groups, seed=DEFAULT_SEED, work_dir=None):
+    """
+    Run the selected benchmark groups at every scale.
+
+    Returns (results, mismatches): {scale label: {benchmark name: timing()}}
+    and the "scale/engine" pairs whose output differed from the reference.
+    """
+    app = charts = None
+    if 'dashboard' in groups or 'charts' in groups:
+        app, charts = import_dashboard()
+
+    results = {}
+    mismatches = []
+    with contextlib.ExitStack() as stack:
+        if work_dir is None:
+            work_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="wfp_bench_"))
+
+        for scale in scales:
+            label = f"{scale:g}"
+            print(f"\n[SCALE {label}] Generating data (seed {seed})...")
+            raw_dir, out_dir = prepare_scale(scale, seed, work_dir)
+            scale_results = {}
+
+            # The dashboard reads the pipeline's outputs, so they are always produced
+            if 'pipeline' in groups:
+                print(f"  - pipeline ({repeat}x)")
+                scale_results.update(bench_pipeline(raw_dir, out_dir, repeat))
+            else:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    run_pipeline(raw_dir, out_dir)
+
+            if 'dashboard' in groups:
+                print(f"  - dashboard ({repeat}x)")
+                scale_results.update(bench_dashboard(app, out_dir, repeat))
+            if 'charts' in groups:
+                print(f"  - charts ({repeat}x)")
+                scale_results.update(bench_charts(app, charts, out_dir, repeat))
+
+            if 'equivalence' in groups:
+                print(f"  - equivalence ({', '.join(EQUIVALENCE_ENGINES)})")
+                equivalence_results, mismatched = bench_equivalence(raw_dir, out_dir, EQUIVALENCE_ENGINES)
+                scale_results.update(equivalence_results)
+                mismatches += [f"{label}/{engine}" for engine in mismatched]
+
+            results[label] = scale_results
+            print(f"✓ Scale {label}: {len(scale_results)} benchmarks")
+
+    return results, mismatches
+
+
+def load_baseline(path):
+    """Load the stored baseline, or None if it is missing or from another format"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION:
+        return None
+    return baseline
+
+
+def save_baseline(results, path, settings):
+    baseline = {
+        'version': BASELINE_VERSION,
+        'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'machine': {
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'cpu_count': os.cpu_count(),
+        },
+        'settings': settings,
+        'results': {scale: {name: {key: round(seconds, 6) for key, seconds in result.items()}
+                            for name, result in scale_results.items()}
+                    for scale, scale_results in results.items()},
+    }
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare_results(results, baseline, threshold, noise_floor=NOISE_FLOOR_S):
+    """
+    Compare a run with the baseline.
+
+    A change only counts when it is beyond threshold and larger than the
+    noise of the benchmark: the larger spread of its repeat runs, now or in
+    the baseline, and at least noise_floor.
+
+    Returns a list of (scale, benchmark, baseline_s, current_s, status) rows
+    where status is 'ok', 'faster', 'REGRESSED' or 'new'.
+    """
+    rows = []
+    for scale, scale_results in results.items():
+        reference = baseline['results'].get(scale, {})
+        for name, result in sorted(scale_results.items()):
+            current = result['best']
+            if name not in reference:
+                rows.append((scale, name, None, current, 'new'))
+                continue
+            before = reference[name]['best']
+            noise = max(noise_floor, result['spread'], reference[name]['spread'])
+            if current > before * (1 + threshold) and current - before > noise:
+                status = 'REGRESSED'
+            elif current < before / (1 + threshold) and before - current > noise:
+                status = 'faster'
+            else:
+                status = 'ok'
+            rows.append((scale, name, before, current, status))
+    return rows
+
+
+def missing_benchmarks(results, baseline, groups):
+    """Baseline benchmarks of the scales and groups that ran which this run did not produce"""
+    missing = []
+    for scale, scale_results in results.items():
+        for name in sorted(baseline['results'].get(scale, {})):
+            if name.split('.')[0] in groups and name not in scale_results:
+                missing.append((scale, name))
+    return missing
+
+
+def print_comparison(rows):
+    print("\n" + "="*80)
+    print("BENCHMARK RESULTS vs BASELINE")
+    print("="*80)
+    print(f"{'scale':>6} {'benchmark':<44} {'base (s)':>9} {'now (s)':>9} {'ratio':>6}  status")
+    for scale, name, before, current, status in rows:
+        base = f"{before:9.4f}" if before is not None else f"{'-':>9}"
+        ratio = f"{current / before:6.2f}" if before else f"{'-':>6}"
+        print(f"{scale:>6} {name:<44} {base} {current:9.4f} {ratio}  {status}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the cleaning pipeline and dashboard functions")
+    parser.add_argument('--scales', nargs='+', type=float, default=DEFAULT_SCALES,
+                        help=f"Synthetic data scales to run (default {' '.join(map(str, DEFAULT_SCALES))})")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f"Runs per benchmark; the best is kept (default {DEFAULT_REPEAT})")
+    parser.add_argument('--groups', nargs='+', choices=GROUPS, default=DEFAULT_GROUPS,
+                        help=f"Benchmark groups to run (default {' '.join(DEFAULT_GROUPS)})")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="Synthetic data seed")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed slowdown vs the baseline, as a fraction (default {DEFAULT_THRESHOLD})")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="Baseline JSON file")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Write this run's results as the new baseline instead of comparing")
+    parser.add_argument('--allow-new', action='store_true',
+                        help="Only warn about benchmarks missing from the baseline, or from this run")
+    parser.add_argument('--work-dir', default=None,
+                        help="Keep the generated data here and reuse it across runs (default: a temp dir)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    warnings.filterwarnings('ignore')
+    args = parse_args(argv)
+
+    print("="*80)
+    print("WORKFORCE PLANNING BENCHMARK SUITE")
+    print("="*80)
+
+    results, mismatches = run_benchmarks(args.scales, args.repeat, args.groups, args.seed, args.work_dir)
+    if mismatches:
+        print(f"\n✗ Cleaned outputs differ from the reference: {', '.join(mismatches)}")
+        return 1
+
+    settings = {'scales': args.scales, 'repeat': args.repeat, 'groups': args.groups, 'seed': args.seed}
+    if args.update_baseline:
+        save_baseline(results, args.baseline, settings)
+        print(f"\n✓ Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\n⚠ No baseline at {args.baseline} - run with --update-baseline first")
+        return 1
+
+    rows = compare_results(results, baseline, args.threshold)
+    print_comparison(rows)
+
+    # A benchmark without a baseline is never checked, so the baseline must
+    # be refreshed whenever the suite changes
+    new = [(scale, name) for scale, name, _, _, status in rows if status == 'new']
+    missing = missing_benchmarks(results, baseline, args.groups)
+    for label, gaps in [("have no baseline and were not checked", new),
+                        ("are in the baseline but did not run", missing)]:
+        if gaps:
+            print(f"\n⚠ {len(gaps)} benchmark(s) {label}:")
+            for scale, name in gaps:
+                print(f"    scale {scale}: {name}")
+    if (new or missing) and not args.allow_new:
+        print("✗ The baseline is out of date - run with --update-baseline after reviewing the change "
+              "(or pass --allow-new)")
+        return 1
+
+    regressed = [row for row in rows if row[4] == 'REGRESSED']
+    if regressed:
+        print(f"\n✗ {len(regressed)} benchmark(s) regressed more than {args.threshold:.0%}")
+        return 1
+    print(f"\n✓ No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Per-Column Profiles of the Cleaned Tables
+Purpose: Summarize every column of every cleaned table while the pipeline
+still has it in memory, so the verifier and the dashboard can read the
+statistics without loading the rows again
+
+The pipeline writes column_profiles.json next to the cleaned outputs:
+
+    {"generated": "...", "tables": {"employees_master": {"rows": 5000, "columns": {
+        "age": {"dtype": "int64", "count": 5000, "nulls": 0, "distinct": 43,
+                "min": 18, "max": 60, "mean": 38.9,
+                "quantiles": {"p05": 21.0, "p25": 28.0, ...},
+                "histogram": {"edges": [...], "counts": [...]},
+                "top": [[35, 151], [42, 149], ...]}, ...}}}}
+
+Each column costs one value_counts (a hash pass over the rows); nulls,
+distinct count and top values come straight from the counts, and min/max,
+mean, quantiles and the histogram from the sorted distinct values weighted by
+their counts. Counts from several chunks add up, so a streamed table gets
+exactly the profile an in-memory run would give it; memory grows with the
+number of distinct values, not rows.
+"""
+
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+COLUMN_PROFILES_FILE = "column_profiles.json"
+
+TOP_K = 10
+HISTOGRAM_BINS = 20
+QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+
+def _json_value(value):
+    """Plain JSON value for a numpy/pandas scalar (timestamps as ISO strings)"""
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def _sort_by_value(counts):
+    """counts ordered by value, or as-is when the values do not compare"""
+    try:
+        return counts.sort_index()
+    except TypeError:
+        return counts
+
+
+class TableProfiler:
+    """
+    Accumulates per-column value counts over one or more frames of a table.
+
+    add() each frame (the whole table, or chunk by chunk) and call result()
+    for the finished profile.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.dtypes = {}
+        self.nulls = {}
+        self.counts = {}
+
+    def add(self, df):
+        self.rows += len(df)
+        for column in df.columns:
+            values = df[column]
+            counts = values.value_counts(dropna=True, sort=False)
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                counts = counts[counts > 0]
+                counts.index = counts.index.astype(values.dtype.categories.dtype)
+            self.dtypes.setdefault(column, str(values.dtype))
+            self.nulls[column] = self.nulls.get(column, 0) + len(values) - int(counts.sum())
+            if column in self.counts:
+                counts = pd.concat([self.counts[column], counts]).groupby(level=0, sort=False).sum()
+            self.counts[column] = counts
+        return self
+
+    def result(self):
+        return {'rows': self.rows,
+                'columns': {column: self._column(column) for column in self.counts}}
+
+    def _column(self, column):
+        counts = _sort_by_value(self.counts[column])
+        count = int(counts.sum())
+        dtype = self.dtypes[column]
+        profile = {'dtype': dtype, 'count': count, 'nulls': self.nulls[column], 'distinct': len(counts)}
+
+        # Unique columns (IDs, codes) have no meaningful top values
+        if len(counts) < count:
+            top = counts.sort_values(ascending=False, kind='stable').head(TOP_K)
+            profile['top'] = [[_json_value(value), int(n)] for value, n in top.items()]
+
+        index_dtype = counts.index.dtype
+        kind = index_dtype.kind if isinstance(index_dtype, np.dtype) else ''
+        if count and kind in ('i', 'u', 'f', 'M'):
+            profile.update(_numeric_summary(counts, kind))
+        return profile
+
+
+def _numeric_summary(counts, kind):
+    """min/max, mean, quantiles and histogram from sorted distinct values and their counts"""
+    weights = counts.to_numpy(dtype=np.int64)
+    if kind == 'M':
+        values = pd.DatetimeIndex(counts.index).as_unit('ns').asi8.astype(np.float64)
+        def convert(x):
+            return pd.Timestamp(int(round(x))).isoformat()
+    else:
+        values = counts.index.to_numpy(dtype=np.float64)
+        convert = _json_value
+    n = int(weights.sum())
+    cumulative = np.cumsum(weights)
+
+    def nth(k):
+        # k-th value (0-based) of the sorted column
+        return values[np.searchsorted(cumulative, k, side='right')]
+
+    quantiles = {}
+    for q in QUANTILES:
+        # Linear interpolation, as Series.quantile does
+        position = q * (n - 1)
+        low, high = nth(int(np.floor(position))), nth(int(np.ceil(position)))
+        quantiles[f"p{int(q * 100):02d}"] = convert(low + (high - low) * (position - np.floor(position)))
+
+    hist_counts, edges = np.histogram(values, bins=HISTOGRAM_BINS, weights=weights)
+    summary = {
+        'min': convert(values[0]) if kind == 'M' else _json_value(counts.index[0]),
+        'max': convert(values[-1]) if kind == 'M' else _json_value(counts.index[-1]),
+        'quantiles': quantiles,
+        'histogram': {'edges': [convert(edge) for edge in edges],
+                      'counts': [int(c) for c in hist_counts]},
+    }
+    if kind != 'M':
+        summary['mean'] = float(np.dot(values, weights) / n)
+    return summary
+
+
+def profile_table(df):
+    """Profile of a whole in-memory table"""
+    return TableProfiler().add(df).result()
+
+
+def load_column_profiles(out_dir):
+    """{table: profile} from out_dir's column_profiles.json, or {} if absent"""
+    path = os.path.join(out_dir, COLUMN_PROFILES_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f).get('tables', {})
+
+
+def save_column_profiles(profiles, out_dir):
+    """
+    Write the profiles of this run's tables into column_profiles.json,
+    keeping the entries of tables this run did not touch
+    """
+    tables = load_column_profiles(out_dir)
+    tables.update(profiles)
+    path = os.path.join(out_dir, COLUMN_PROFILES_FILE)
+    with open(path, 'w') as f:
+        json.dump({'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'tables': tables}, f)
+    return path
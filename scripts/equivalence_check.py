@@ -0,0 +1,314 @@
+"""
+Differential Equivalence Check
+Purpose: Prove that an alternative way of running the cleaning pipeline
+produces exactly the tables the reference (in-memory, single-process) run does
+
+Each engine in ENGINES is a set of run_pipeline options. The check cleans the
+same raw inputs with the reference engine and every candidate into separate
+output directories and compares each *_cleaned table:
+
+- columns (names and order) and dtypes, read from the typed Parquet copy
+- rows, matched on the table's ID column after a canonical sort (or on all
+  columns when the ID is not unique)
+- values column by column, with missing values equal to each other
+- the CSV bytes, since the dashboard falls back to the CSV copy
+- the quarantine file of each table: the same rejected rows, in any order
+
+Synthetic data (--scale) is generated with DEFAULT_DIRTY_RATE of duplicate
+keys, out-of-range values, bad references and unparseable dates per table,
+so the check covers the de-duplication, rejection and quarantine paths where
+the engines are most likely to drift apart.
+
+Everything is vectorized per column, so a 1M-row dataset compares in a few
+seconds; benchmark_suite.py runs it as its 'equivalence' group.
+
+Usage:
+    python equivalence_check.py --skip attendance_records
+    python equivalence_check.py --scale 3 --engines chunked parallel_chunked
+    python equivalence_check.py --scale 1 --dirty-rate 0      # clean synthetic data
+    python equivalence_check.py --raw-dir /tmp/raw_dirty --reference-dir /tmp/processed_dirty
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from data_cleaning_pipeline import (
+    DEFAULT_RAW_DIR, HAS_PYARROW, STEP_NAMES, TABLE_LABELS, cleaned_path, quarantine_path, run_pipeline,
+)
+from generate_synthetic_data import generate_dataset, write_dataset
+from pipeline_manifest import file_digest
+
+# Engine name -> run_pipeline options
+ENGINES = {
+    'reference': {},
+    'chunked': {'chunk_size': 100_000},
+    'parallel': {'workers': 2},
+    'parallel_chunked': {'workers': 2, 'chunk_size': 100_000},
+}
+REFERENCE_ENGINE = 'reference'
+
+# Share of rows per table and problem kind corrupted in --scale data
+DEFAULT_DIRTY_RATE = 0.02
+
+# Mismatching values shown per column
+MAX_EXAMPLES = 3
+
+
+def run_engine(engine, raw_dir, out_dir, skip=None, quiet=True):
+    """Clean raw_dir into out_dir with one engine; returns the wall time"""
+    os.makedirs(out_dir, exist_ok=True)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+        run_pipeline(raw_dir, out_dir, skip=skip, **ENGINES[engine])
+    return time.perf_counter() - start
+
+
+def read_output(out_dir, table):
+    """A cleaned table exactly as written: the Parquet copy, else the CSV"""
+    parquet_path = cleaned_path(out_dir, table, 'parquet')
+    if HAS_PYARROW and os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path)
+    return pd.read_csv(cleaned_path(out_dir, table))
+
+
+def canonical_order(df):
+    """
+    Sort rows by the ID column (first column), or by every column when the
+    ID is not unique. Returns (sorted frame, key column or None).
+    """
+    key = df.columns[0] if len(df.columns) else None
+    if key is not None and df[key].is_unique:
+        return df.sort_values(key, kind='stable').reset_index(drop=True), key
+    return df.sort_values(list(df.columns), kind='stable').reset_index(drop=True), None
+
+
+def value_mismatches(a, b):
+    """Boolean mask of positions where two aligned Series differ (NA == NA)"""
+    both_missing = (a.isna() & b.isna()).to_numpy()
+    try:
+        equal = a.eq(b).fillna(False).to_numpy(dtype=bool)
+    except TypeError:
+        equal = (a.astype(str) == b.astype(str)).to_numpy()
+    return ~(equal | both_missing)
+
+
+def compare_tables(reference, candidate):
+    """
+    Compare two versions of one cleaned table.
+
+    Returns a dict of findings; every entry is empty or zero when the tables
+    are identical: missing/extra columns, order_differs, dtypes (column ->
+    (reference, candidate)), reference_only/candidate_only row counts and
+    values (column -> (count, examples)).
+    """
+    diff = {
+        'rows': (len(reference), len(candidate)),
+        'missing_columns': [c for c in reference.columns if c not in candidate.columns],
+        'extra_columns': [c for c in candidate.columns if c not in reference.columns],
+        'order_differs': False,
+        'dtypes': {},
+        'reference_only': 0,
+        'candidate_only': 0,
+        'values': {},
+    }
+    common = [c for c in reference.columns if c in candidate.columns]
+    diff['order_differs'] = common != [c for c in candidate.columns if c in reference.columns]
+    for column in common:
+        if reference[column].dtype != candidate[column].dtype:
+            diff['dtypes'][column] = (str(reference[column].dtype), str(candidate[column].dtype))
+
+    reference, key = canonical_order(reference[common])
+    candidate, candidate_key = canonical_order(candidate[common])
+
+    if key is not None and key == candidate_key:
+        # Match rows on the ID, then compare the IDs both sides have
+        ref_ids = reference[key].to_numpy()
+        cand_ids = candidate[key].to_numpy()
+        in_candidate = np.isin(ref_ids, cand_ids)
+        in_reference = np.isin(cand_ids, ref_ids)
+        diff['reference_only'] = int((~in_candidate).sum())
+        diff['candidate_only'] = int((~in_reference).sum())
+        reference = reference[in_candidate].reset_index(drop=True)
+        candidate = candidate[in_reference].reset_index(drop=True)
+    elif len(reference) != len(candidate):
+        # No usable ID: count the rows each side has that the other lacks
+        merged = reference.merge(candidate, how='outer', on=common, indicator=True)
+        diff['reference_only'] = int((merged['_merge'] == 'left_only').sum())
+        diff['candidate_only'] = int((merged['_merge'] == 'right_only').sum())
+        return diff
+
+    for column in common:
+        mask = value_mismatches(reference[column], candidate[column])
+        count = int(mask.sum())
+        if count:
+            rows = np.flatnonzero(mask)[:MAX_EXAMPLES]
+            labels = reference[key].to_numpy()[rows] if key is not None else rows
+            examples = [(label, reference[column].iloc[i], candidate[column].iloc[i])
+                        for label, i in zip(labels, rows)]
+            diff['values'][column] = (count, examples)
+    return diff
+
+
+def is_identical(diff):
+    """True if compare_outputs found no difference of any kind"""
+    if diff.get('missing_table'):
+        return False
+    return not (diff['missing_columns'] or diff['extra_columns'] or diff['order_differs']
+                or diff['dtypes'] or diff['reference_only'] or diff['candidate_only']
+                or diff['values'] or not diff.get('csv_identical', True))
+
+
+def compare_outputs(reference_dir, candidate_dir, tables=None):
+    """
+    Compare every cleaned table present in reference_dir with candidate_dir.
+
+    Returns {table: diff}; a table missing from candidate_dir gets
+    {'missing_table': True}. diff['csv_identical'] records whether the CSV
+    copies are byte-for-byte equal. Quarantine files are compared under
+    'quarantine/<table>', by content only: chunked runs write the rejected
+    rows in a different order.
+    """
+    results = {}
+    for table in tables or TABLE_LABELS:
+        if not os.path.exists(cleaned_path(reference_dir, table)):
+            continue
+        if not os.path.exists(cleaned_path(candidate_dir, table)):
+            results[table] = {'missing_table': True}
+            continue
+        diff = compare_tables(read_output(reference_dir, table), read_output(candidate_dir, table))
+        diff['csv_identical'] = (file_digest(cleaned_path(reference_dir, table))['sha256']
+                                 == file_digest(cleaned_path(candidate_dir, table))['sha256'])
+        results[table] = diff
+
+        reference = read_quarantine(reference_dir, table)
+        candidate = read_quarantine(candidate_dir, table)
+        if reference is not None:
+            results[f"quarantine/{table}"] = ({'missing_table': True} if candidate is None
+                                              else compare_tables(reference, candidate))
+        elif candidate is not None:
+            results[f"quarantine/{table}"] = compare_tables(candidate.iloc[:0], candidate)
+    return results
+
+
+def read_quarantine(out_dir, table):
+    """A table's quarantine file, or None if the run rejected nothing"""
+    parquet_path = quarantine_path(out_dir, table, 'parquet')
+    if HAS_PYARROW and os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path)
+    csv_path = quarantine_path(out_dir, table, 'csv')
+    return pd.read_csv(csv_path) if os.path.exists(csv_path) else None
+
+
+def print_diff_summary(results, engine):
+    """Print one line per identical table and a compact breakdown otherwise"""
+    print(f"\n[COMPARE] {engine} vs {REFERENCE_ENGINE}")
+    for table, diff in results.items():
+        if diff.get('missing_table'):
+            print(f"  ✗ {table}: missing from the {engine} output")
+            continue
+        rows = f"{diff['rows'][0]:,} rows"
+        if is_identical(diff):
+            print(f"  ✓ {table}: identical ({rows})")
+            continue
+
+        print(f"  ✗ {table}: {rows} in reference, {diff['rows'][1]:,} in {engine}")
+        if diff['missing_columns']:
+            print(f"      columns missing: {', '.join(diff['missing_columns'])}")
+        if diff['extra_columns']:
+            print(f"      columns extra:   {', '.join(diff['extra_columns'])}")
+        if diff['order_differs']:
+            print("      column order differs")
+        for column, (ref_dtype, cand_dtype) in diff['dtypes'].items():
+            print(f"      dtype  {column}: {ref_dtype} vs {cand_dtype}")
+        if diff['reference_only'] or diff['candidate_only']:
+            print(f"      rows   {diff['reference_only']:,} only in reference, "
+                  f"{diff['candidate_only']:,} only in {engine}")
+        for column, (count, examples) in diff['values'].items():
+            shown = "; ".join(f"{row}: {ref} vs {cand}" for row, ref, cand in examples)
+            print(f"      value  {column}: {count:,} rows (e.g. {shown})")
+        if not diff.get('csv_identical', True):
+            print("      CSV copies differ")
+
+
+def check_equivalence(raw_dir, work_dir, engines, skip=None, reference_dir=None):
+    """
+    Run the reference (unless reference_dir already holds its output) and each
+    candidate engine on raw_dir, and compare. Returns {engine: {table: diff}}.
+    """
+    if reference_dir is None:
+        reference_dir = os.path.join(work_dir, REFERENCE_ENGINE)
+        elapsed = run_engine(REFERENCE_ENGINE, raw_dir, reference_dir, skip)
+        print(f"✓ {REFERENCE_ENGINE}: cleaned in {elapsed:.2f}s")
+
+    results = {}
+    for engine in engines:
+        out_dir = os.path.join(work_dir, engine)
+        elapsed = run_engine(engine, raw_dir, out_dir, skip)
+        print(f"✓ {engine}: cleaned in {elapsed:.2f}s")
+        start = time.perf_counter()
+        results[engine] = compare_outputs(reference_dir, out_dir)
+        print_diff_summary(results[engine], engine)
+        print(f"  ({time.perf_counter() - start:.2f}s to compare)")
+    return results
+
+
+def parse_args(argv=None):
+    candidates = [name for name in ENGINES if name != REFERENCE_ENGINE]
+    parser = argparse.ArgumentParser(description="Compare cleaning engines against the reference run")
+    parser.add_argument('--engines', nargs='+', choices=candidates, default=candidates,
+                        help="Candidate engines to check (default all)")
+    parser.add_argument('--raw-dir', default=DEFAULT_RAW_DIR, help="Directory with the raw CSVs")
+    parser.add_argument('--scale', type=float, default=None,
+                        help="Check on synthetic data of this scale instead of --raw-dir")
+    parser.add_argument('--dirty-rate', type=float, default=DEFAULT_DIRTY_RATE,
+                        help=f"Share of corrupted rows in the --scale data (default {DEFAULT_DIRTY_RATE})")
+    parser.add_argument('--skip', nargs='+', metavar='STEP', choices=STEP_NAMES,
+                        help="Steps to skip in every engine")
+    parser.add_argument('--reference-dir', default=None,
+                        help="Existing reference output to compare against instead of re-running it")
+    parser.add_argument('--work-dir', default=None, help="Where engine outputs go (default: a temp dir)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    warnings.filterwarnings('ignore')
+    args = parse_args(argv)
+
+    print("="*80)
+    print("CLEANING ENGINE EQUIVALENCE CHECK")
+    print("="*80)
+
+    with contextlib.ExitStack() as stack:
+        work_dir = args.work_dir or stack.enter_context(tempfile.TemporaryDirectory(prefix="wfp_equiv_"))
+        raw_dir = args.raw_dir
+        if args.scale is not None:
+            raw_dir = os.path.join(work_dir, "raw")
+            tables, injected = generate_dataset(args.scale, dirty_rate=args.dirty_rate)
+            with contextlib.redirect_stdout(io.StringIO()):
+                write_dataset(tables, raw_dir)
+            print(f"✓ Generated scale {args.scale:g}: {sum(len(df) for df in tables.values()):,} raw rows, "
+                  f"{sum(sum(counts.values()) for counts in injected.values()):,} of them corrupted")
+
+        results = check_equivalence(raw_dir, work_dir, args.engines, args.skip, args.reference_dir)
+
+    failed = [engine for engine, tables in results.items()
+              if not all(is_identical(diff) for diff in tables.values())]
+    print("\n" + "="*80)
+    if failed:
+        print(f"✗ Outputs differ from the reference: {', '.join(failed)}")
+        return 1
+    print(f"✓ All engines match the reference: {', '.join(results)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
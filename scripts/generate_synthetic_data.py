@@ -0,0 +1,522 @@
+"""
+Synthetic Workforce Data Generator
+Purpose: Write all nine raw tables at any scale for load-testing the cleaning pipeline
+
+The tables follow the raw schemas data_cleaning_pipeline.py reads, with the
+same column order and date formats as data/raw. --scale multiplies the
+5,000-employee base; child tables keep the source cardinalities (1-3 job
+history rows, 2-4 compensation rows, 1-3 reviews, 1-2 surveys, 2-4 skills
+and one attendance row per month per employee) across 20 departments.
+
+Everything is generated with numpy from one seeded Generator, so the same
+arguments always produce the same files. Dates are formatted through
+lookup tables (one string per distinct day, one per time of day) instead of
+strftime per row, and label columns are Categoricals built from codes.
+
+--dirty-rate injects the problems the cleaning steps exist to catch, in
+that fraction of each table's rows per kind: duplicate IDs, out-of-range
+ages/levels/ratings, unknown employee_ids, unparseable dates, flags outside
+BOOLEAN_MAPPING ('true', 'Yes', ...) and untrimmed, mixed-case labels.
+
+Usage:
+    python generate_synthetic_data.py --out-dir /tmp/raw_500k --scale 100
+    python generate_synthetic_data.py --out-dir /tmp/raw_dirty --scale 10 --dirty-rate 0.01 --seed 7
+    python generate_synthetic_data.py --out-dir /tmp/raw_2m --scale 400 --attendance-months 12
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+BASE_EMPLOYEES = 5000
+N_DEPARTMENTS = 20
+
+HIRE_START = np.datetime64('2010-01-01T00:00:00', 's')
+HIRE_END = np.datetime64('2023-01-01T00:00:00', 's')
+ANALYSIS_END = np.datetime64('2024-12-31T00:00:00', 's')
+REVIEW_START = np.datetime64('2018-01-01T00:00:00', 's')
+SURVEY_START = np.datetime64('2019-01-01T00:00:00', 's')
+ACTIVITY_END = np.datetime64('2024-01-01T00:00:00', 's')
+ATTENDANCE_START = np.datetime64('2019-01', 'M')
+
+EFFECTIVE_DATES = ['1/1/2015', '1/1/2016', '12/31/2016', '12/31/2017']
+
+GENDERS = ['Male', 'Female']
+MARITAL_STATUSES = ['Single', 'Married', 'Divorced']
+EDUCATION_FIELDS = ['Medical', 'Life Sciences', 'Technical', 'Marketing', 'HR']
+EMPLOYMENT_TYPES = ['Full-time', 'Contract']
+BUSINESS_TRAVEL = ['Travel_Frequently', 'Non-Travel', 'Travel_Rarely']
+WORK_LOCATIONS = ['Hybrid', 'Remote', 'Office']
+JOB_ROLES = ['Manager', 'HR Manager', 'Data Analyst', 'Sales Executive', 'Software Engineer']
+BUSINESS_UNITS = ['Technology', 'Operations', 'Corporate']
+REGIONS = ['APAC', 'EMEA']
+ATTRITION_REASONS = ['Career Growth', 'Work-Life Balance', 'Salary', 'Manager Issues']
+JOB_CHANGE_REASONS = ['Promotion', 'Transfer', 'Role Change']
+SALARY_BANDS = ['Low', 'Medium', 'High']
+LEAVE_TYPES = ['Sick', 'Casual', 'Paid', 'None']
+SKILLS = {
+    'SQL': 'Technical', 'Python': 'Technical', 'Excel': 'Technical', 'Power BI': 'Technical',
+    'Communication': 'Soft', 'Leadership': 'Soft',
+}
+
+# Raw file name -> primary key, in pipeline order
+RAW_TABLES = {
+    'department_master': 'department_id',
+    'employees_master': 'employee_id',
+    'attrition_events': 'attrition_id',
+    'job_history': 'job_history_id',
+    'compensation_history': 'compensation_id',
+    'attendance_records': 'attendance_id',
+    'performance_reviews': 'review_id',
+    'engagement_surveys': 'survey_id',
+    'training_and_skills': 'skill_id',
+}
+
+# Dirty-data targets per table
+OUT_OF_RANGE = {
+    'employees_master': {'age': [15, 85], 'job_level': [0, 9], 'education_level': [0, 7]},
+    'attrition_events': {'exit_interview_score': [0, 6]},
+    'job_history': {'job_level': [0, 9]},
+    'compensation_history': {'percent_hike': [-50.0, 150.0], 'stock_option_level': [5, 7]},
+    'attendance_records': {'days_absent': [35, 40], 'work_from_home_days': [32, 45]},
+    'performance_reviews': {'performance_rating': [0, 6], 'goal_completion_pct': [120.0, -5.0]},
+    'engagement_surveys': {'job_satisfaction': [0, 6], 'career_growth': [0, 9]},
+    'training_and_skills': {'proficiency_level': [0, 6]},
+}
+DATE_COLUMNS = {
+    'employees_master': ['hire_date'],
+    'attrition_events': ['attrition_date'],
+    'job_history': ['start_date'],
+    'compensation_history': ['effective_date'],
+    'attendance_records': ['month'],
+    'performance_reviews': ['review_date'],
+    'engagement_surveys': ['survey_date'],
+}
+FLAG_COLUMNS = {
+    'attrition_events': ['rehire_eligible'],
+    'job_history': ['promotion_flag'],
+    'performance_reviews': ['promotion_recommendation'],
+    'training_and_skills': ['training_completed', 'certification_flag'],
+}
+LABEL_COLUMNS = {
+    'employees_master': ['gender', 'marital_status', 'work_location'],
+}
+BAD_DATES = np.array(['not a date', '2/30/2021 10:00', '13/45/2020 9:15', 'TBD'], dtype=object)
+BAD_FLAGS = np.array(['true', 'false', 'Yes', 'no', 'T'], dtype=object)
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+def format_dates(values, style):
+    """
+    Format a datetime64 array as the raw files do, NaT -> missing.
+
+    style: 'iso_seconds' (2012-06-17 19:57:46), 'us_minutes' (6/2/2013 22:43)
+    or 'iso_date' (2019-01-01). Distinct days are formatted once and the time
+    of day comes from a lookup table, so the cost per row is two gathers
+    and one string concatenation.
+    """
+    values = np.asarray(values, dtype='datetime64[s]')
+    missing = np.isnat(values)
+    days = values.astype('datetime64[D]')
+    unique_days, inverse = np.unique(days[~missing], return_inverse=True)
+    index = pd.DatetimeIndex(unique_days)
+
+    if style == 'us_minutes':
+        day_text = np.array([f"{m}/{d}/{y}" for y, m, d in zip(index.year, index.month, index.day)],
+                            dtype=object)
+        minute = (values[~missing] - days[~missing]).astype(np.int64) // 60
+        times = np.array([f" {i // 60}:{i % 60:02d}" for i in range(1440)], dtype=object)
+        text = day_text[inverse] + times[minute]
+    elif style == 'iso_seconds':
+        day_text = np.array(index.strftime('%Y-%m-%d'), dtype=object)
+        second = (values[~missing] - days[~missing]).astype(np.int64)
+        times = np.array([f" {i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}" for i in range(86400)],
+                         dtype=object)
+        text = day_text[inverse] + times[second]
+    elif style == 'iso_date':
+        if not missing.any():
+            return pd.Categorical.from_codes(inverse, categories=index.strftime('%Y-%m-%d'))
+        text = np.array(index.strftime('%Y-%m-%d'), dtype=object)[inverse]
+    else:
+        raise ValueError(f"Unknown date style: {style}")
+
+    result = np.full(len(values), None, dtype=object)
+    result[~missing] = text
+    return result
+
+
+def random_datetimes(rng, start, end):
+    """Uniform datetimes between start and end (arrays or scalars, to the second)"""
+    start = np.asarray(start, dtype='datetime64[s]')
+    span = (np.asarray(end, dtype='datetime64[s]') - start).astype(np.int64)
+    return start + (rng.random(np.broadcast(start, span).shape) * np.maximum(span, 1)).astype('timedelta64[s]')
+
+
+def ceil_to_minute(values):
+    """Round datetimes up to the minute, so minute-precision text never precedes hire"""
+    seconds = np.asarray(values, dtype='datetime64[s]').astype(np.int64)
+    return ((seconds + 59) // 60 * 60).astype('datetime64[s]')
+
+
+def repeat_per_employee(rng, employee_ids, low, high):
+    """
+    Expand employee_ids to low..high rows each.
+
+    Returns (row employee index, position of the row within its employee,
+    rows per employee).
+    """
+    counts = rng.integers(low, high + 1, len(employee_ids))
+    owner = np.repeat(np.arange(len(employee_ids)), counts)
+    first_row = np.cumsum(counts) - counts
+    position = np.arange(len(owner)) - np.repeat(first_row, counts)
+    return owner, position, counts
+
+
+def choice(rng, values, size, p=None):
+    """
+    rng.choice over a list of labels, as a Categorical so no per-row string
+    objects are built
+    """
+    return pd.Categorical.from_codes(rng.choice(len(values), size, p=p), categories=values)
+
+
+def flags(rng, size, p_true=0.5):
+    """Boolean flags written as TRUE/FALSE like the raw exports"""
+    return pd.Categorical.from_codes((rng.random(size) < p_true).astype(np.int8),
+                                     categories=['FALSE', 'TRUE'])
+
+
+# ============================================================================
+# TABLE GENERATORS
+# ============================================================================
+def generate_department_master(rng):
+    """The 20 departments, with generic Department_N names for STEP 2 to fix"""
+    ids = np.arange(1, N_DEPARTMENTS + 1)
+    regions = np.asarray(choice(rng, REGIONS, N_DEPARTMENTS), dtype=object)
+    regions[rng.random(N_DEPARTMENTS) < 0.4] = None
+    return pd.DataFrame({
+        'department_id': ids,
+        'department_name': [f"Department_{i}" for i in ids],
+        'business_unit': choice(rng, BUSINESS_UNITS, N_DEPARTMENTS, p=[0.45, 0.3, 0.25]),
+        'region': regions,
+        'cost_center': [f"CC{i:03d}" for i in ids],
+    })
+
+
+def generate_employees_master(rng, n_employees, attrition_rate):
+    """
+    Employees hired 2010-2022. Returns (table, hire datetimes, attrited mask)
+    so the child tables can be dated after each hire.
+    """
+    ids = np.arange(1, n_employees + 1)
+    hire = random_datetimes(rng, np.full(n_employees, HIRE_START), HIRE_END)
+    attrited = np.zeros(n_employees, dtype=bool)
+    attrited[rng.choice(n_employees, int(round(n_employees * attrition_rate)), replace=False)] = True
+
+    manager_id = rng.integers(1, n_employees + 1, n_employees).astype(float)
+    manager_id[rng.random(n_employees) < 0.4] = np.nan
+
+    employees = pd.DataFrame({
+        'employee_id': ids,
+        'employee_code': 'EMP' + pd.Series(ids).astype(str).str.zfill(5),
+        'age': rng.integers(21, 60, n_employees),
+        'gender': choice(rng, GENDERS, n_employees),
+        'marital_status': choice(rng, MARITAL_STATUSES, n_employees),
+        'education_level': rng.integers(1, 6, n_employees),
+        'education_field': choice(rng, EDUCATION_FIELDS, n_employees),
+        'hire_date': format_dates(hire, 'iso_seconds'),
+        'employment_type': choice(rng, EMPLOYMENT_TYPES, n_employees, p=[0.85, 0.15]),
+        'business_travel': choice(rng, BUSINESS_TRAVEL, n_employees),
+        'distance_from_home_km': rng.integers(1, 50, n_employees),
+        'work_location': choice(rng, WORK_LOCATIONS, n_employees),
+        'department_id': rng.integers(1, N_DEPARTMENTS + 1, n_employees),
+        'job_role': choice(rng, JOB_ROLES, n_employees),
+        'job_level': rng.integers(1, 6, n_employees),
+        'manager_id': manager_id,
+        'status': pd.Categorical.from_codes(attrited.astype(np.int8), categories=['Active', 'Attrited']),
+    })
+    return employees, hire, attrited
+
+
+def generate_attrition_events(rng, employees, hire, attrited):
+    """One exit per attrited employee, dated between hire and the analysis end"""
+    index = np.flatnonzero(attrited)
+    rng.shuffle(index)
+    n = len(index)
+    return pd.DataFrame({
+        'attrition_id': np.arange(1, n + 1),
+        'employee_id': employees['employee_id'].to_numpy()[index],
+        'attrition_flag': pd.Categorical.from_codes(np.ones(n, dtype=np.int8), categories=['FALSE', 'TRUE']),
+        'attrition_date': format_dates(ceil_to_minute(random_datetimes(rng, hire[index], ANALYSIS_END)), 'us_minutes'),
+        'attrition_reason': choice(rng, ATTRITION_REASONS, n),
+        'exit_interview_score': rng.integers(1, 6, n),
+        'rehire_eligible': flags(rng, n, 0.4),
+    })
+
+
+def generate_job_history(rng, employees, hire):
+    """
+    1-3 consecutive positions per employee starting at hire; each ends when
+    the next starts and the current one is open-ended
+    """
+    owner, position, counts = repeat_per_employee(rng, employees, 1, 3)
+    n = len(owner)
+
+    # Later positions split the time between hire and 2024 into random steps
+    available = (ACTIVITY_END - hire[owner]).astype(np.int64)
+    gaps = (available * rng.uniform(0.3, 1.0, n) / np.repeat(counts, counts)).astype(np.int64)
+    gaps[position == 0] = 0
+    elapsed = np.cumsum(gaps)
+    elapsed -= np.repeat(elapsed[position == 0], counts)
+    start = ceil_to_minute(hire[owner] + elapsed.astype('timedelta64[s]'))
+    end = np.full(n, np.datetime64('NaT'), dtype='datetime64[s]')
+    end[:-1] = start[1:]
+    end[position == np.repeat(counts - 1, counts)] = np.datetime64('NaT')
+
+    remaining = np.repeat(counts - 1, counts) - position
+    level = np.maximum(employees['job_level'].to_numpy()[owner] - remaining, 1)
+    promoted = np.zeros(n, dtype=bool)
+    promoted[1:] = (level[1:] > level[:-1]) & (position[1:] > 0)
+
+    department = rng.integers(1, N_DEPARTMENTS + 1, n)
+    current = remaining == 0
+    department[current] = employees['department_id'].to_numpy()[owner[current]]
+
+    return pd.DataFrame({
+        'job_history_id': np.arange(1, n + 1),
+        'employee_id': employees['employee_id'].to_numpy()[owner],
+        'department_id': department,
+        'job_role': choice(rng, JOB_ROLES, n),
+        'job_level': level,
+        'start_date': format_dates(start, 'us_minutes'),
+        'end_date': format_dates(end, 'us_minutes'),
+        'promotion_flag': pd.Categorical.from_codes(promoted.astype(np.int8), categories=['FALSE', 'TRUE']),
+        'job_change_reason': choice(rng, JOB_CHANGE_REASONS, n),
+    })
+
+
+def generate_compensation_history(rng, employees):
+    """2-4 yearly pay records per employee on the source's fixed effective dates"""
+    owner, position, _ = repeat_per_employee(rng, employees, 2, 4)
+    n = len(owner)
+    base = 20000 + employees['job_level'].to_numpy()[owner] * rng.integers(8000, 20000, n)
+    return pd.DataFrame({
+        'compensation_id': np.arange(1, n + 1),
+        'employee_id': employees['employee_id'].to_numpy()[owner],
+        'effective_date': pd.Categorical.from_codes(position, categories=EFFECTIVE_DATES),
+        'monthly_income': base,
+        'salary_band': choice(rng, SALARY_BANDS, n),
+        'percent_hike': rng.uniform(5, 15, n),
+        'bonus_amount': rng.integers(5000, 50000, n),
+        'stock_option_level': rng.integers(0, 4, n),
+    })
+
+
+def generate_attendance_records(rng, employees, months):
+    """One row per employee per month from January 2019"""
+    n_employees = len(employees)
+    n = n_employees * months
+    owner = np.repeat(np.arange(n_employees), months)
+    month = ATTENDANCE_START + np.tile(np.arange(months), n_employees).astype('timedelta64[M]')
+    present = rng.integers(15, 23, n)
+    return pd.DataFrame({
+        'attendance_id': np.arange(1, n + 1),
+        'employee_id': employees['employee_id'].to_numpy()[owner],
+        'month': format_dates(month.astype('datetime64[D]'), 'iso_date'),
+        'days_present': present,
+        'days_absent': rng.integers(0, 6, n),
+        'overtime_hours': np.round(rng.exponential(6, n), 1),
+        'work_from_home_days': np.minimum(rng.integers(0, 11, n), present),
+        'leave_type': choice(rng, LEAVE_TYPES, n, p=[0.15, 0.15, 0.1, 0.6]),
+    })
+
+
+def generate_performance_reviews(rng, employees, hire):
+    """1-3 reviews per employee from 2018 (or hire) to 2023"""
+    owner, _, _ = repeat_per_employee(rng, employees, 1, 3)
+    n = len(owner)
+    review = ceil_to_minute(random_datetimes(rng, np.maximum(hire[owner], REVIEW_START), ACTIVITY_END))
+    return pd.DataFrame({
+        'review_id': np.arange(1, n + 1),
+        'employee_id': employees['employee_id'].to_numpy()[owner],
+        'review_date': format_dates(review, 'us_minutes'),
+        'performance_rating': rng.integers(1, 6, n),
+        'manager_rating': rng.integers(1, 6, n),
+        'goal_completion_pct': rng.uniform(50, 100, n),
+        'promotion_recommendation': flags(rng, n, 0.3),
+    })
+
+
+def generate_engagement_surveys(rng, employees, hire):
+    """1-2 surveys per employee from 2019 (or hire) to 2023"""
+    owner, _, _ = repeat_per_employee(rng, employees, 1, 2)
+    n = len(owner)
+    survey = ceil_to_minute(random_datetimes(rng, np.maximum(hire[owner], SURVEY_START), ACTIVITY_END))
+    ratings = rng.integers(1, 6, (4, n))
+    return pd.DataFrame({
+        'survey_id': np.arange(1, n + 1),
+        'employee_id': employees['employee_id'].to_numpy()[owner],
+        'survey_date': format_dates(survey, 'us_minutes'),
+        'job_satisfaction': ratings[0],
+        'work_life_balance': ratings[1],
+        'manager_relationship': ratings[2],
+        'career_growth': ratings[3],
+        'engagement_score': ratings.mean(axis=0).round(2),
+    })
+
+
+def generate_training_and_skills(rng, employees):
+    """2-4 skills per employee"""
+    owner, _, _ = repeat_per_employee(rng, employees, 2, 4)
+    n = len(owner)
+    skill = choice(rng, list(SKILLS), n)
+    return pd.DataFrame({
+        'skill_id': np.arange(1, n + 1),
+        'employee_id': employees['employee_id'].to_numpy()[owner],
+        'skill_name': skill,
+        'skill_category': skill.map(SKILLS),
+        'proficiency_level': rng.integers(1, 6, n),
+        'training_completed': flags(rng, n, 0.6),
+        'certification_flag': flags(rng, n, 0.25),
+    })
+
+
+# ============================================================================
+# DIRTY DATA
+# ============================================================================
+def inject_dirty_data(rng, tables, rate, n_employees):
+    """
+    Corrupt `rate` of each table's rows per kind of problem, in place of
+    clean values, and append duplicate-ID rows. Returns {table: {kind: rows}}.
+    """
+    injected = {}
+    for table, df in tables.items():
+        counts = {}
+        k = int(round(len(df) * rate))
+        if k == 0:
+            injected[table] = counts
+            continue
+
+        def pick():
+            return rng.choice(len(df), min(k, len(df)), replace=False)
+
+        # Corrupted text values are not among a Categorical's categories
+        for column in DATE_COLUMNS.get(table, []) + FLAG_COLUMNS.get(table, []) + LABEL_COLUMNS.get(table, []):
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype(object)
+
+        for column, values in OUT_OF_RANGE.get(table, {}).items():
+            rows = pick()
+            df.loc[rows, column] = np.asarray(values)[rng.integers(0, len(values), len(rows))]
+            counts[f"{column}_out_of_range"] = len(rows)
+        for column in DATE_COLUMNS.get(table, []):
+            rows = pick()
+            df.loc[rows, column] = BAD_DATES[rng.integers(0, len(BAD_DATES), len(rows))]
+            counts[f"{column}_unparseable"] = len(rows)
+        for column in FLAG_COLUMNS.get(table, []):
+            rows = pick()
+            df.loc[rows, column] = BAD_FLAGS[rng.integers(0, len(BAD_FLAGS), len(rows))]
+            counts[f"{column}_unrecognized"] = len(rows)
+        for column in LABEL_COLUMNS.get(table, []):
+            rows = pick()
+            labels = df.loc[rows, column].astype(str)
+            df.loc[rows, column] = np.where(rng.random(len(rows)) < 0.5,
+                                            ' ' + labels.str.lower(), labels.str.upper() + ' ')
+            counts[f"{column}_untrimmed"] = len(rows)
+        if 'employee_id' in df.columns and table != 'employees_master':
+            rows = pick()
+            df.loc[rows, 'employee_id'] = n_employees + rng.integers(1, n_employees + 1, len(rows))
+            counts['employee_id_unknown'] = len(rows)
+
+        if table != 'department_master':
+            duplicates = df.iloc[pick()]
+            tables[table] = pd.concat([df, duplicates], ignore_index=True)
+            counts[f"{RAW_TABLES[table]}_duplicate"] = len(duplicates)
+        injected[table] = counts
+    return injected
+
+
+# ============================================================================
+# DATASET
+# ============================================================================
+def generate_dataset(scale=1.0, seed=42, attrition_rate=0.24, dirty_rate=0.0, attendance_months=60):
+    """
+    Build all nine raw tables in memory.
+
+    Returns (tables, injected): {table: DataFrame} in pipeline order and the
+    dirty-data counts per table (empty when dirty_rate is 0).
+    """
+    rng = np.random.default_rng(seed)
+    n_employees = max(int(round(BASE_EMPLOYEES * scale)), 1)
+
+    employees, hire, attrited = generate_employees_master(rng, n_employees, attrition_rate)
+    tables = {
+        'department_master': generate_department_master(rng),
+        'employees_master': employees,
+        'attrition_events': generate_attrition_events(rng, employees, hire, attrited),
+        'job_history': generate_job_history(rng, employees, hire),
+        'compensation_history': generate_compensation_history(rng, employees),
+        'attendance_records': generate_attendance_records(rng, employees, attendance_months),
+        'performance_reviews': generate_performance_reviews(rng, employees, hire),
+        'engagement_surveys': generate_engagement_surveys(rng, employees, hire),
+        'training_and_skills': generate_training_and_skills(rng, employees),
+    }
+    if attendance_months == 0:
+        del tables['attendance_records']
+
+    injected = inject_dirty_data(rng, tables, dirty_rate, n_employees) if dirty_rate else {}
+    return tables, injected
+
+
+def write_dataset(tables, out_dir):
+    """Write each table to <out_dir>/<table>.csv"""
+    os.makedirs(out_dir, exist_ok=True)
+    for table, df in tables.items():
+        start = time.perf_counter()
+        df.to_csv(os.path.join(out_dir, f"{table}.csv"), index=False)
+        print(f"✓ {table}.csv: {len(df):,} rows ({time.perf_counter() - start:.2f}s)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic raw workforce tables")
+    parser.add_argument('--out-dir', required=True, help="Directory to write the raw CSVs to")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help=f"Multiple of the {BASE_EMPLOYEES:,}-employee base (default 1)")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed (default 42)")
+    parser.add_argument('--attrition-rate', type=float, default=0.24,
+                        help="Share of employees with an attrition event (default 0.24)")
+    parser.add_argument('--dirty-rate', type=float, default=0.0,
+                        help="Share of rows per table and problem kind to corrupt (default 0)")
+    parser.add_argument('--attendance-months', type=int, default=60,
+                        help="Attendance rows per employee (default 60, 0 = no attendance table)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("="*80)
+    print("SYNTHETIC WORKFORCE DATA GENERATOR")
+    print("="*80)
+
+    start = time.perf_counter()
+    tables, injected = generate_dataset(args.scale, args.seed, args.attrition_rate,
+                                        args.dirty_rate, args.attendance_months)
+    print(f"\n✓ Generated {sum(len(df) for df in tables.values()):,} rows "
+          f"in {time.perf_counter() - start:.2f}s (seed {args.seed})")
+
+    for table, counts in injected.items():
+        if counts:
+            print(f"  - {table}: " + ", ".join(f"{kind} {count:,}" for kind, count in counts.items()))
+
+    print(f"\n[WRITE] {args.out_dir}")
+    write_dataset(tables, args.out_dir)
+
+
+if __name__ == "__main__":
+    main()
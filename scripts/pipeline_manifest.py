@@ -0,0 +1,205 @@
+"""
+Pipeline Manifest for Incremental Re-runs
+Purpose: Record content hashes of raw inputs and cleaned outputs so
+data_cleaning_pipeline.py can re-clean only what changed
+
+The manifest lives next to the cleaned outputs as pipeline_manifest.json.
+Every step gets a signature built from the pipeline code, the hash of its raw
+file and the signatures of the steps it depends on, so a changed input
+re-runs its own step and everything downstream of it:
+
+- employees_master.csv changes -> STEP 3, then every step using valid_emp_ids
+- attrition_events.csv changes -> STEP 4, then STEP 11 status sync (and STEP 12,
+  which rewrites the same table)
+
+A step also re-runs when one of its table's outputs is missing or no longer
+matches the hash recorded after the last run.
+
+The manifest also keeps each table's quality-report summary, so a run that
+re-cleans a few tables reports the others without reading them back.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+
+MANIFEST_FILE = "pipeline_manifest.json"
+MANIFEST_VERSION = 1
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_digest(path, previous=None):
+    """
+    Return {'sha256', 'size', 'mtime_ns'} for a file, or None if it is missing.
+
+    When `previous` has the same size and mtime the stored hash is reused
+    instead of re-reading the file.
+    """
+    if not os.path.exists(path):
+        return None
+
+    stat = os.stat(path)
+    if previous and previous.get('size') == stat.st_size and previous.get('mtime_ns') == stat.st_mtime_ns:
+        return dict(previous)
+
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            sha.update(block)
+    return {'sha256': sha.hexdigest(), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def code_version(paths):
+    """Hash of the pipeline source files; any code change re-runs every step"""
+    sha = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            sha.update(f.read())
+    return sha.hexdigest()
+
+
+def load_manifest(out_dir):
+    """Load the manifest from out_dir, or an empty one if absent or unreadable"""
+    path = os.path.join(out_dir, MANIFEST_FILE)
+    empty = {'version': MANIFEST_VERSION, 'raw_files': {}, 'steps': {}, 'outputs': {}}
+    if not os.path.exists(path):
+        return empty
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return empty
+    if manifest.get('version') != MANIFEST_VERSION:
+        return empty
+    return manifest
+
+
+def save_manifest(manifest, out_dir):
+    """Write the manifest atomically"""
+    path = os.path.join(out_dir, MANIFEST_FILE)
+    manifest['generated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def step_dependencies(step, steps, references):
+    """
+    Names of the steps whose results `step` reads.
+
+    A table dependency resolves to the last earlier step that writes that
+    table; a reference set (valid_emp_ids, ...) to the last earlier writer
+    of its source table. A step without a raw file also depends on the
+    previous step on its own table.
+    """
+    earlier = steps[:steps.index(step)]
+
+    def last_writer(table):
+        writers = [s['name'] for s in earlier if s['table'] == table]
+        return writers[-1] if writers else None
+
+    tables = [references[name][0] if name in references else name for name in step['uses']]
+    if step['raw'] is None:
+        tables.append(step['table'])
+
+    deps = []
+    for table in tables:
+        writer = last_writer(table)
+        if writer and writer not in deps:
+            deps.append(writer)
+    return deps
+
+
+def compute_signatures(steps, raw_dir, references, manifest, version):
+    """
+    Hash every raw input and derive a signature for every step.
+
+    Returns (signatures, raw_entries). Steps are signed in pipeline order so
+    each one folds in the signatures of its dependencies.
+    """
+    raw_entries = {}
+    signatures = {}
+    for step in steps:
+        raw_hash = None
+        if step['raw']:
+            entry = file_digest(os.path.join(raw_dir, step['raw']),
+                                manifest['raw_files'].get(step['raw']))
+            raw_entries[step['raw']] = entry
+            raw_hash = entry['sha256'] if entry else 'missing'
+
+        payload = {
+            'code': version,
+            'raw': raw_hash,
+            'deps': [signatures[name] for name in step_dependencies(step, steps, references)],
+        }
+        signatures[step['name']] = hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode()
+        ).hexdigest()
+    return signatures, raw_entries
+
+
+def output_files(table):
+    """File names a cleaned table is written to"""
+    return [f"{table}_cleaned.csv", f"{table}_cleaned.parquet"]
+
+
+def outputs_intact(table, manifest, out_dir):
+    """True if every output recorded for the table still matches its hash"""
+    recorded = {name: manifest['outputs'].get(name) for name in output_files(table)}
+    if not recorded[f"{table}_cleaned.csv"]:
+        return False
+    for name, entry in recorded.items():
+        if entry is None:
+            continue
+        current = file_digest(os.path.join(out_dir, name), entry)
+        if current is None or current['sha256'] != entry['sha256']:
+            return False
+    return True
+
+
+def find_stale_steps(steps, signatures, manifest, out_dir):
+    """
+    Return {step name: reason} for steps that must re-run.
+
+    A step is stale when its signature differs from the recorded one (new
+    code, changed raw file, or a stale dependency) or when its table's
+    outputs are missing or were modified since the last run.
+    """
+    stale = {}
+    intact = {}
+    for step in steps:
+        recorded = manifest['steps'].get(step['name'], {}).get('signature')
+        if recorded is None:
+            stale[step['name']] = 'never run'
+        elif recorded != signatures[step['name']]:
+            stale[step['name']] = 'inputs changed'
+        else:
+            if step['table'] not in intact:
+                intact[step['table']] = outputs_intact(step['table'], manifest, out_dir)
+            if not intact[step['table']]:
+                stale[step['name']] = 'output missing or modified'
+    return stale
+
+
+def record_run(manifest, steps_run, signatures, raw_entries, tables_saved, out_dir, summaries=None):
+    """Update the manifest after a successful run; summaries are {table: report summary}"""
+    now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    for step in steps_run:
+        manifest['steps'][step['name']] = {'signature': signatures[step['name']], 'completed': now}
+        if step['raw'] and raw_entries.get(step['raw']):
+            manifest['raw_files'][step['raw']] = raw_entries[step['raw']]
+
+    for table in tables_saved:
+        for name in output_files(table):
+            entry = file_digest(os.path.join(out_dir, name))
+            if entry:
+                manifest['outputs'][name] = entry
+            else:
+                manifest['outputs'].pop(name, None)
+
+    manifest.setdefault('tables', {}).update(summaries or {})
+    return manifest
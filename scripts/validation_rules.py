@@ -0,0 +1,296 @@
+"""
+Declarative Validation Rules for the Cleaning Pipeline
+Purpose: One catalog of per-table row rules, evaluated in a single vectorized pass
+
+Each rule is a plain dict:
+
+    {'type': 'range', 'column': 'age', 'min': 18, 'max': 70}
+    {'type': 'range', 'column': 'monthly_income', 'min': 0, 'min_inclusive': False}
+    {'type': 'not_null', 'column': 'employee_id'}
+    {'type': 'foreign_key', 'column': 'employee_id', 'reference': 'valid_emp_ids'}
+    {'type': 'date_order', 'start': 'start_date', 'end': 'end_date', 'allow_open_end': True}
+    {'type': 'after_hire', 'column': 'attrition_date'}
+    {'type': 'after_hire', 'column': 'review_date', 'severity': 'warn'}
+    {'type': 'sum_range', 'columns': ['days_present', 'days_absent'], 'max': 31}
+
+Rules reject failing rows by default; 'severity': 'warn' only counts them.
+after_hire rules look hire dates up in an EmployeeDateIndex (the hire_dates
+reference), a dense array indexed by employee_id, so they cost one gather
+per row instead of a join with employees_master.
+
+evaluate_rules() builds one boolean mask per rule straight from the column
+arrays, ANDs them into a single keep-mask and reports how many rows failed
+each rule; apply_rules() then filters the table once. Like the chained
+filters it replaces, a comparison against a missing value fails the rule.
+
+Rejected rows are not thrown away: apply_rules() and drop_duplicate_keys()
+return them, tagged with the rules they failed, next to the kept rows, and
+the step hands them back to the runner for the table's quarantine file.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Column naming the failed rule(s) of each quarantined row
+QUARANTINE_TAG_COLUMN = 'failed_rules'
+
+RULES = {
+    'department_master': [],
+    'employees_master': [
+        {'type': 'not_null', 'column': 'employee_id'},
+        {'type': 'range', 'column': 'age', 'min': 18, 'max': 70},
+        {'type': 'range', 'column': 'job_level', 'min': 1, 'max': 5},
+        {'type': 'range', 'column': 'education_level', 'min': 1, 'max': 5},
+        {'type': 'foreign_key', 'column': 'department_id', 'reference': 'valid_dept_ids'},
+    ],
+    'attrition_events': [
+        {'type': 'foreign_key', 'column': 'employee_id', 'reference': 'valid_emp_ids'},
+        {'type': 'after_hire', 'column': 'attrition_date'},
+        {'type': 'range', 'column': 'exit_interview_score', 'min': 1, 'max': 5},
+    ],
+    'job_history': [
+        {'type': 'foreign_key', 'column': 'employee_id', 'reference': 'valid_emp_ids'},
+        {'type': 'foreign_key', 'column': 'department_id', 'reference': 'valid_dept_ids'},
+        {'type': 'date_order', 'start': 'start_date', 'end': 'end_date', 'allow_open_end': True},
+        {'type': 'range', 'column': 'job_level', 'min': 1, 'max': 5},
+        {'type': 'after_hire', 'column': 'start_date', 'severity': 'warn'},
+    ],
+    'compensation_history': [
+        {'type': 'foreign_key', 'column': 'employee_id', 'reference': 'valid_emp_ids'},
+        {'type': 'range', 'column': 'monthly_income', 'min': 0, 'min_inclusive': False},
+        {'type': 'range', 'column': 'percent_hike', 'min': -20, 'max': 100},
+        {'type': 'range', 'column': 'bonus_amount', 'min': 0},
+        {'type': 'range', 'column': 'stock_option_level', 'min': 0, 'max': 4},
+        {'type': 'after_hire', 'column': 'effective_date', 'severity': 'warn'},
+    ],
+    'attendance_records': [
+        {'type': 'foreign_key', 'column': 'employee_id', 'reference': 'valid_emp_ids'},
+        {'type': 'range', 'column': 'days_present', 'min': 0, 'max': 31},
+        {'type': 'range', 'column': 'days_absent', 'min': 0, 'max': 31},
+        {'type': 'range', 'column': 'overtime_hours', 'min': 0},
+        {'type': 'range', 'column': 'work_from_home_days', 'min': 0, 'max': 31},
+        {'type': 'sum_range', 'columns': ['days_present', 'days_absent'], 'max': 31},
+    ],
+    'performance_reviews': [
+        {'type': 'foreign_key', 'column': 'employee_id', 'reference': 'valid_emp_ids'},
+        {'type': 'range', 'column': 'performance_rating', 'min': 1, 'max': 5},
+        {'type': 'range', 'column': 'manager_rating', 'min': 1, 'max': 5},
+        {'type': 'range', 'column': 'goal_completion_pct', 'min': 0, 'max': 100},
+        {'type': 'after_hire', 'column': 'review_date', 'severity': 'warn'},
+    ],
+    'engagement_surveys': [
+        {'type': 'foreign_key', 'column': 'employee_id', 'reference': 'valid_emp_ids'},
+        {'type': 'range', 'column': 'job_satisfaction', 'min': 1, 'max': 5},
+        {'type': 'range', 'column': 'work_life_balance', 'min': 1, 'max': 5},
+        {'type': 'range', 'column': 'manager_relationship', 'min': 1, 'max': 5},
+        {'type': 'range', 'column': 'career_growth', 'min': 1, 'max': 5},
+        {'type': 'after_hire', 'column': 'survey_date', 'severity': 'warn'},
+    ],
+    'training_and_skills': [
+        {'type': 'foreign_key', 'column': 'employee_id', 'reference': 'valid_emp_ids'},
+        {'type': 'range', 'column': 'proficiency_level', 'min': 1, 'max': 5},
+    ],
+}
+
+
+class EmployeeDateIndex:
+    """
+    employee_id -> date lookup for per-row date checks.
+
+    Non-negative integer IDs are stored in a dense datetime array indexed by
+    the ID itself, so a lookup is a single array gather; other IDs fall back
+    to a pandas Index. Unknown IDs give NaT, which fails any comparison.
+    """
+
+    MAX_DENSE_ID = 2 ** 27
+
+    def __init__(self, employee_ids, dates):
+        self.ids = np.asarray(employee_ids)
+        self.dates = np.asarray(dates, dtype='datetime64[ns]')
+        self.dense = None
+        self.index = None
+        if (self.ids.dtype.kind in 'iu' and len(self.ids)
+                and self.ids.min() >= 0 and self.ids.max() < self.MAX_DENSE_ID):
+            self.dense = np.full(int(self.ids.max()) + 1, np.datetime64('NaT'), dtype='datetime64[ns]')
+            self.dense[self.ids] = self.dates
+
+    def lookup(self, employee_ids):
+        """Dates for employee_ids as a datetime64[ns] array, NaT where unknown"""
+        ids = np.asarray(employee_ids)
+        if self.dense is not None and ids.dtype.kind in 'iu':
+            result = np.full(len(ids), np.datetime64('NaT'), dtype='datetime64[ns]')
+            inside = (ids >= 0) & (ids < len(self.dense))
+            result[inside] = self.dense[ids[inside]]
+            return result
+        if self.index is None:
+            self.index = pd.Index(self.ids)
+        positions = self.index.get_indexer(ids)
+        return np.where(positions >= 0, self.dates[positions], np.datetime64('NaT', 'ns'))
+
+
+def rule_name(rule):
+    """Short, stable identifier for a rule (used in reports and quarantine tags)"""
+    kind = rule['type']
+    if kind == 'range':
+        return f"{rule['column']}_range"
+    if kind == 'not_null':
+        return f"{rule['column']}_not_null"
+    if kind == 'foreign_key':
+        return f"{rule['column']}_fk"
+    if kind == 'date_order':
+        return f"{rule['end']}_after_{rule['start']}"
+    if kind == 'after_hire':
+        return f"{rule['column']}_after_hire"
+    if kind == 'sum_range':
+        return f"{'_plus_'.join(rule['columns'])}_range"
+    raise ValueError(f"Unknown rule type: {kind}")
+
+
+def describe_rule(rule):
+    """Human-readable description of a rule"""
+    kind = rule['type']
+    if kind in ('range', 'sum_range'):
+        subject = rule['column'] if kind == 'range' else ' + '.join(rule['columns'])
+        bounds = []
+        if rule.get('min') is not None:
+            bounds.append(f"{'>=' if rule.get('min_inclusive', True) else '>'} {rule['min']}")
+        if rule.get('max') is not None:
+            bounds.append(f"{'<=' if rule.get('max_inclusive', True) else '<'} {rule['max']}")
+        return f"{subject} {' and '.join(bounds)}"
+    if kind == 'not_null':
+        return f"{rule['column']} is not null"
+    if kind == 'foreign_key':
+        return f"{rule['column']} in {rule['reference']}"
+    if kind == 'date_order':
+        suffix = " (or open-ended)" if rule.get('allow_open_end') else ""
+        return f"{rule['end']} >= {rule['start']}{suffix}"
+    if kind == 'after_hire':
+        return f"{rule['column']} >= employee hire_date"
+    return rule_name(rule)
+
+
+def _bounds_mask(values, rule):
+    """values within the rule's min/max; missing values fail"""
+    values = np.asarray(values, dtype=float)
+    mask = ~np.isnan(values)
+    if rule.get('min') is not None:
+        mask &= (values >= rule['min']) if rule.get('min_inclusive', True) else (values > rule['min'])
+    if rule.get('max') is not None:
+        mask &= (values <= rule['max']) if rule.get('max_inclusive', True) else (values < rule['max'])
+    return mask
+
+
+def rule_mask(df, rule, references):
+    """Boolean numpy array: True where the row passes the rule"""
+    kind = rule['type']
+    if kind == 'range':
+        return _bounds_mask(pd.to_numeric(df[rule['column']], errors='coerce'), rule)
+    if kind == 'sum_range':
+        total = sum(pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+                    for column in rule['columns'])
+        return _bounds_mask(total, rule)
+    if kind == 'not_null':
+        return df[rule['column']].notna().to_numpy()
+    if kind == 'foreign_key':
+        return df[rule['column']].isin(references[rule['reference']]).to_numpy()
+    if kind == 'date_order':
+        start = df[rule['start']]
+        end = df[rule['end']]
+        mask = (end >= start).to_numpy()
+        if rule.get('allow_open_end'):
+            mask = mask | end.isna().to_numpy()
+        return mask
+    if kind == 'after_hire':
+        hire_dates = references['hire_dates'].lookup(df['employee_id'])
+        return df[rule['column']].to_numpy() >= hire_dates
+    raise ValueError(f"Unknown rule type: {kind}")
+
+
+def evaluate_rules(df, rules, references):
+    """
+    Evaluate every rule against df in one pass.
+
+    Returns (keep, failures, masks): the combined boolean keep-mask of the
+    rejecting rules, an ordered {rule name: rows failing that rule} dict and
+    the per-rule pass masks. A row failing several rules is counted under
+    each of them; 'warn' rules are counted but do not affect keep.
+    """
+    keep = np.ones(len(df), dtype=bool)
+    failures = {}
+    masks = {}
+    for rule in rules:
+        passed = rule_mask(df, rule, references)
+        masks[rule_name(rule)] = passed
+        failures[rule_name(rule)] = int(len(df) - passed.sum())
+        if rule.get('severity', 'reject') == 'reject':
+            keep &= passed
+    return keep, failures, masks
+
+
+def failure_tags(masks, rejected):
+    """
+    ';'-joined names of the rules each rejected row failed.
+
+    The failed rules are packed into one bit per rule, so the label strings
+    are only built once per distinct combination rather than once per row.
+    """
+    names = list(masks)
+    codes = np.zeros(int(rejected.sum()), dtype=np.int64)
+    for bit, passed in enumerate(masks.values()):
+        codes |= (~passed[rejected]).astype(np.int64) << bit
+    unique, inverse = np.unique(codes, return_inverse=True)
+    labels = np.array([';'.join(name for bit, name in enumerate(names) if code >> bit & 1)
+                       for code in unique], dtype=object)
+    return labels[inverse]
+
+
+def tag_rejected(rows, tags):
+    """Copy of dropped rows tagged with why they failed, or None if there are none"""
+    if not len(rows):
+        return None
+    rows = rows.copy()
+    rows[QUARANTINE_TAG_COLUMN] = tags
+    return rows
+
+
+def combine_rejected(*parts):
+    """Concatenate tag_rejected() results, skipping None; None if all are"""
+    parts = [rows for rows in parts if rows is not None]
+    if not parts:
+        return None
+    return pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+
+
+def drop_duplicate_keys(df, key):
+    """
+    drop_duplicates(subset=[key]). Returns (kept rows, dropped rows tagged
+    '<key>_duplicate' or None).
+    """
+    duplicated = df.duplicated(subset=[key]).to_numpy()
+    return df[~duplicated], tag_rejected(df[duplicated], f"{key}_duplicate")
+
+
+def apply_rules(df, table, **references):
+    """
+    Filter df by the table's rule catalog with a single boolean index.
+
+    The per-rule counts are printed and kept in df.attrs['rule_rejections']
+    and, for 'warn' rules, df.attrs['rule_warnings'] so the runner can record
+    them. Returns (kept rows, rejected rows or None), the rejected rows
+    tagged from the same masks for the quarantine file.
+    """
+    rules = RULES[table]
+    keep, failures, masks = evaluate_rules(df, rules, references)
+    rejecting = [rule_name(rule) for rule in rules if rule.get('severity', 'reject') == 'reject']
+    rejected = None
+    if not keep.all():
+        rejected = tag_rejected(df[~keep], failure_tags({name: masks[name] for name in rejecting}, ~keep))
+    df = df[keep].copy()
+
+    for rule in rules:
+        outcome = 'rejected' if rule_name(rule) in rejecting else 'flagged (kept)'
+        print(f"✓ Validated {describe_rule(rule)}: {failures[rule_name(rule)]:,} {outcome}")
+
+    df.attrs['rule_rejections'] = {name: failures[name] for name in rejecting}
+    df.attrs['rule_warnings'] = {name: count for name, count in failures.items() if name not in rejecting}
+    return df, rejected
@@ -1,11 +1,18 @@
 """
 Data Validation & Verification Script
 Purpose: Verify cleaned data quality and generate final statistics
+
+Per-column checks (ranges, nulls, uniqueness, dtypes) and the summary
+statistics come from the column_profiles.json the pipeline writes; only the
+ID and status columns needed for cross-table checks are read from the
+cleaned files. Tables without a stored profile are loaded and profiled here.
 """
 
 import pandas as pd
 import numpy as np
 
+from column_profile import load_column_profiles, profile_table
+
 print("="*80)
 print("DATA VALIDATION & VERIFICATION REPORT")
 print("="*80)
@@ -14,17 +21,45 @@ import os
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CLEANED_PATH = os.path.join(os.path.dirname(SCRIPT_DIR), "data", "processed") + os.sep
 
-# Load all cleaned data
-print("\n[1] Loading cleaned datasets...")
-employees = pd.read_csv(f"{CLEANED_PATH}employees_master_cleaned.csv")
-departments = pd.read_csv(f"{CLEANED_PATH}department_master_cleaned.csv")
-attrition = pd.read_csv(f"{CLEANED_PATH}attrition_events_cleaned.csv")
-job_history = pd.read_csv(f"{CLEANED_PATH}job_history_cleaned.csv")
-compensation = pd.read_csv(f"{CLEANED_PATH}compensation_history_cleaned.csv")
-attendance = pd.read_csv(f"{CLEANED_PATH}attendance_records_cleaned.csv")
-performance = pd.read_csv(f"{CLEANED_PATH}performance_reviews_cleaned.csv")
-engagement = pd.read_csv(f"{CLEANED_PATH}engagement_surveys_cleaned.csv")
-training = pd.read_csv(f"{CLEANED_PATH}training_and_skills_cleaned.csv")
+TABLES = ["employees_master", "department_master", "attrition_events", "job_history",
+          "compensation_history", "attendance_records", "performance_reviews",
+          "engagement_surveys", "training_and_skills"]
+
+# Tables the pipeline skips when their raw file is missing; checked only if present
+OPTIONAL_TABLES = ["attendance_records"]
+
+def is_available(name):
+    return any(os.path.exists(f"{CLEANED_PATH}{name}_cleaned.{ext}") for ext in ("parquet", "csv"))
+
+def load_cleaned(name, columns=None):
+    """Load a cleaned table (or some of its columns), preferring the typed Parquet copy over the CSV"""
+    parquet_path = f"{CLEANED_PATH}{name}_cleaned.parquet"
+    if os.path.exists(parquet_path):
+        try:
+            return pd.read_parquet(parquet_path, columns=columns)
+        except ImportError:
+            pass
+    return pd.read_csv(f"{CLEANED_PATH}{name}_cleaned.csv", usecols=columns)
+
+# Load the column profiles, and the columns the cross-table checks need
+print("\n[1] Loading column profiles and key columns...")
+profiles = load_column_profiles(CLEANED_PATH)
+for name in TABLES:
+    if name in OPTIONAL_TABLES and not is_available(name):
+        print(f"  - {name} not found (optional), counted as empty")
+        profiles[name] = profile_table(pd.DataFrame())
+    elif name not in profiles:
+        print(f"  - No stored profile for {name}, profiling it now")
+        profiles[name] = profile_table(load_cleaned(name))
+
+def column(table, name):
+    return profiles[table]['columns'][name]
+
+employees = load_cleaned("employees_master", ["employee_id", "department_id", "status"])
+departments = load_cleaned("department_master")
+attrition = load_cleaned("attrition_events", ["employee_id"])
+job_history = load_cleaned("job_history", ["employee_id"])
+compensation = load_cleaned("compensation_history", ["employee_id"])
 
 print("✓ All datasets loaded successfully")
 
@@ -46,11 +81,23 @@ def test(name, condition):
         print(f"✗ FAIL: {name}")
     return condition
 
+def is_unique(table, name):
+    col = column(table, name)
+    return col['nulls'] == 0 and col['distinct'] == col['count']
+
+def in_range(table, name, low, high):
+    col = column(table, name)
+    return col['count'] == 0 or (col['nulls'] == 0 and col['min'] >= low and col['max'] <= high)
+
+def is_boolean(table, name):
+    col = column(table, name)
+    return col['dtype'] in ('bool', 'boolean') and col['nulls'] == 0
+
 # Test 1: Check for duplicates
 print("\n--- Duplicate Checks ---")
-test("Employees: No duplicate IDs", employees['employee_id'].is_unique)
-test("Departments: No duplicate IDs", departments['department_id'].is_unique)
-test("Attrition: No duplicate employee_ids", attrition['employee_id'].is_unique)
+test("Employees: No duplicate IDs", is_unique("employees_master", "employee_id"))
+test("Departments: No duplicate IDs", is_unique("department_master", "department_id"))
+test("Attrition: No duplicate employee_ids", is_unique("attrition_events", "employee_id"))
 
 # Test 2: Referential integrity
 print("\n--- Referential Integrity ---")
@@ -65,14 +112,10 @@ test("All compensation employee_ids exist in employees",
 
 # Test 3: Data ranges
 print("\n--- Data Range Validation ---")
-test("Employee ages between 18-70", 
-     (employees['age'] >= 18).all() and (employees['age'] <= 70).all())
-test("Job levels between 1-5", 
-     (employees['job_level'] >= 1).all() and (employees['job_level'] <= 5).all())
-test("Performance ratings between 1-5", 
-     (performance['performance_rating'] >= 1).all() and (performance['performance_rating'] <= 5).all())
-test("Engagement scores between 1-5", 
-     (engagement['engagement_score'] >= 1).all() and (engagement['engagement_score'] <= 5).all())
+test("Employee ages between 18-70", in_range("employees_master", "age", 18, 70))
+test("Job levels between 1-5", in_range("employees_master", "job_level", 1, 5))
+test("Performance ratings between 1-5", in_range("performance_reviews", "performance_rating", 1, 5))
+test("Engagement scores between 1-5", in_range("engagement_surveys", "engagement_score", 1, 5))
 
 # Test 4: Department names are meaningful
 print("\n--- Department Name Validation ---")
@@ -87,16 +130,14 @@ test("Attrition status matches between tables", attrited_in_master == attrited_i
 
 # Test 6: Boolean standardization
 print("\n--- Boolean Standardization ---")
-test("Attrition flags are boolean type", 
-     attrition['attrition_flag'].dtype == bool or attrition['attrition_flag'].isin([True, False]).all())
-test("Rehire eligible are boolean type", 
-     attrition['rehire_eligible'].dtype == bool or attrition['rehire_eligible'].isin([True, False]).all())
+test("Attrition flags are boolean type", is_boolean("attrition_events", "attrition_flag"))
+test("Rehire eligible are boolean type", is_boolean("attrition_events", "rehire_eligible"))
 
 # Test 7: No missing critical values
 print("\n--- Missing Values Check ---")
-test("No missing employee_ids", employees['employee_id'].notna().all())
-test("No missing hire_dates", employees['hire_date'].notna().all())
-test("No missing attrition_dates", attrition['attrition_date'].notna().all())
+test("No missing employee_ids", column("employees_master", "employee_id")['nulls'] == 0)
+test("No missing hire_dates", column("employees_master", "hire_date")['nulls'] == 0)
+test("No missing attrition_dates", column("attrition_events", "attrition_date")['nulls'] == 0)
 
 # Print Summary Statistics
 print("\n" + "="*80)
@@ -108,19 +149,19 @@ print(f"   Total Employees: {len(employees):,}")
 print(f"   Active Employees: {(employees['status'] == 'Active').sum():,}")
 print(f"   Attrited Employees: {(employees['status'] == 'Attrited').sum():,}")
 print(f"   Departments: {len(departments):,}")
-print(f"   Job History Records: {len(job_history):,}")
-print(f"   Compensation Records: {len(compensation):,}")
-print(f"   Attendance Records: {len(attendance):,}")
-print(f"   Performance Reviews: {len(performance):,}")
-print(f"   Engagement Surveys: {len(engagement):,}")
-print(f"   Training Records: {len(training):,}")
+print(f"   Job History Records: {profiles['job_history']['rows']:,}")
+print(f"   Compensation Records: {profiles['compensation_history']['rows']:,}")
+print(f"   Attendance Records: {profiles['attendance_records']['rows']:,}")
+print(f"   Performance Reviews: {profiles['performance_reviews']['rows']:,}")
+print(f"   Engagement Surveys: {profiles['engagement_surveys']['rows']:,}")
+print(f"   Training Records: {profiles['training_and_skills']['rows']:,}")
 print(f"   Attrition Events: {len(attrition):,}")
 
 print(f"\n📈 Key Metrics:")
 print(f"   Attrition Rate: {(len(attrition) / len(employees) * 100):.2f}%")
-print(f"   Average Age: {employees['age'].mean():.1f} years")
-print(f"   Average Tenure: {employees['tenure_years'].mean():.2f} years")
-print(f"   Gender Distribution: {employees['gender'].value_counts().to_dict()}")
+print(f"   Average Age: {column('employees_master', 'age')['mean']:.1f} years")
+print(f"   Average Tenure: {column('employees_master', 'tenure_years')['mean']:.2f} years")
+print(f"   Gender Distribution: {dict(column('employees_master', 'gender').get('top', []))}")
 
 print(f"\n🏢 Top 5 Departments by Size:")
 dept_size = employees.merge(departments, on='department_id')['department_name'].value_counts().head()
@@ -128,13 +169,13 @@ for dept, count in dept_size.items():
     print(f"   {dept}: {count:,} employees")
 
 print(f"\n📉 Top 5 Attrition Reasons:")
-attrition_reasons = attrition['attrition_reason'].value_counts().head()
-for reason, count in attrition_reasons.items():
+attrition_reasons = column("attrition_events", "attrition_reason").get('top', [])[:5]
+for reason, count in attrition_reasons:
     print(f"   {reason}: {count:,} cases")
 
-print(f"\n⭐ Average Performance Rating: {performance['performance_rating'].mean():.2f}/5")
-print(f"⭐ Average Engagement Score: {engagement['engagement_score'].mean():.2f}/5")
-print(f"⭐ Average Job Satisfaction: {engagement['job_satisfaction'].mean():.2f}/5")
+print(f"\n⭐ Average Performance Rating: {column('performance_reviews', 'performance_rating')['mean']:.2f}/5")
+print(f"⭐ Average Engagement Score: {column('engagement_surveys', 'engagement_score')['mean']:.2f}/5")
+print(f"⭐ Average Job Satisfaction: {column('engagement_surveys', 'job_satisfaction')['mean']:.2f}/5")
 
 # Test Results Summary
 print("\n" + "="*80)